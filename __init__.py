@@ -1,53 +1,265 @@
 """Simplified MyAir3 Integration for Home Assistant."""
 
+import asyncio
+from collections.abc import Callable, Coroutine, Iterable, Sequence
+from dataclasses import replace
 from datetime import timedelta
+from functools import partial
 import logging
+import time
+from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
-from defusedxml.ElementTree import fromstring
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DEFAULT_PASSWORD, DEFAULT_SCAN_INTERVAL, DOMAIN, PLATFORMS
+from .capture import CaptureWriter
+from .const import (
+    COMMAND_DEBOUNCE,
+    CONNECTION_KEEPALIVE,
+    CONNECTION_LIMIT,
+    CONF_CAPTURE,
+    CONF_FAST_POLL_WINDOW,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_REQUEST_LIMIT,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    CONF_ZONE_CONCURRENCY,
+    CONF_ZONE_MAX_AGE,
+    CONF_ZONES_PER_POLL,
+    DEFAULT_CAPTURE,
+    DEFAULT_FAST_POLL_WINDOW,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PASSWORD,
+    DEFAULT_REQUEST_LIMIT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DEFAULT_ZONE_CONCURRENCY,
+    DEFAULT_ZONE_MAX_AGE,
+    DEFAULT_ZONES_PER_POLL,
+    DNS_CACHE_TTL,
+    DOMAIN,
+    PLATFORMS,
+    SCOPE_SYSTEM,
+    SNAPSHOT_STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    ZONE_REMOVAL_POLLS,
+)
 from .device_registry import async_setup_device_registry
+from .metrics import ConnectionMetrics, CoordinatorMetrics
+from .models import (
+    WRITE_PARAMS,
+    ZONE_AVAILABLE,
+    ZONE_TOPOLOGY,
+    SystemState,
+    ZoneState,
+    changed_keys,
+    snapshot_params,
+    snapshot_writes,
+    state_as_dict,
+    state_from_dict,
+    system_keys,
+)
+from .parser import ParseCache, is_acknowledged, parse_system, parse_zone
+from .resilience import (
+    RETRY_ATTEMPTS,
+    AdaptiveTimeouts,
+    CircuitBreaker,
+    backoff_delay,
+)
+from .scheduler import PRIORITY_COMMAND, PRIORITY_POLL, RequestScheduler
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+# Responses the controller gives once the login session has lapsed
+SESSION_EXPIRED_STATUSES = (401, 403)
+SESSION_EXPIRED_MARKER = b"<authenticated>0</authenticated>"
+
+
+# Short connect timeout: the controller is on the LAN or not there at all
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3)
+
+
+class SessionExpired(UpdateFailed):
+    """The controller no longer accepts the current login session."""
+
+
+class ServerError(UpdateFailed):
+    """The controller answered with a 5xx status."""
+
+
+class ControllerUnavailable(UpdateFailed):
+    """Requests are held back because the controller keeps failing."""
+
+
+def _create_controller_session(
+    limit: int, connections: ConnectionMetrics
+) -> aiohttp.ClientSession:
+    """Return a keep-alive session with its own small connection pool.
+
+    limit is the request limit (0 = unlimited); the pool never holds more
+    than CONNECTION_LIMIT connections unless the request limit is higher.
+    New and reused connections are counted in connections.
+    """
+
+    async def on_create(*_: Any) -> None:
+        connections.created += 1
+
+    async def on_reuse(*_: Any) -> None:
+        connections.reused += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_create_end.append(on_create)
+    trace.on_connection_reuseconn.append(on_reuse)
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=max(limit, CONNECTION_LIMIT),
+            limit_per_host=max(limit, CONNECTION_LIMIT),
+            keepalive_timeout=CONNECTION_KEEPALIVE,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        ),
+        timeout=REQUEST_TIMEOUT,
+        trace_configs=[trace],
+    )
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MyAir3 services."""
+    async_setup_services(hass)
+    return True
+
+
+def _coordinator_settings(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the MyAir3Coordinator settings held in a config entry.
+
+    Used both to create the coordinator and to apply changed options to a
+    running one.
+    """
+    options = entry.options
+    return {
+        "password": options.get(
+            CONF_PASSWORD, entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD)
+        ),
+        "scan_interval": options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        "zone_concurrency": options.get(
+            CONF_ZONE_CONCURRENCY, DEFAULT_ZONE_CONCURRENCY
+        ),
+        "fast_scan_interval": options.get(
+            CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL
+        ),
+        "fast_poll_window": options.get(
+            CONF_FAST_POLL_WINDOW, DEFAULT_FAST_POLL_WINDOW
+        ),
+        "idle_scan_interval": options.get(
+            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+        ),
+        "optimistic": options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+        "zones_per_poll": options.get(CONF_ZONES_PER_POLL, DEFAULT_ZONES_PER_POLL),
+        "zone_max_age": options.get(CONF_ZONE_MAX_AGE, DEFAULT_ZONE_MAX_AGE),
+        "request_limit": options.get(CONF_REQUEST_LIMIT, DEFAULT_REQUEST_LIMIT),
+        "timeout_floor": options.get(CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR),
+        "timeout_ceiling": options.get(CONF_TIMEOUT_CEILING, DEFAULT_TIMEOUT_CEILING),
+        "capture": CaptureWriter(
+            hass,
+            hass.config.path(
+                f"{DOMAIN}_capture_{slugify(entry.data[CONF_HOST])}.jsonl"
+            ),
+        )
+        if options.get(CONF_CAPTURE, DEFAULT_CAPTURE)
+        else None,
+    }
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MyAir3 from config entry."""
     host = entry.data[CONF_HOST]
-    password = entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD)
-    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    coordinator = MyAir3Coordinator(hass, host, password, scan_interval)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = MyAir3Coordinator(
+        hass,
+        host,
+        **_coordinator_settings(hass, entry),
+        dedicated_session=True,
+        store=Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"),
+        snapshot_store=Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshots"
+        ),
+    )
+    # Close the dedicated session even if setup fails past this point
+    entry.async_on_unload(coordinator.async_close_session)
+    await coordinator.async_load_snapshots()
+    # Start from the cached state when there is one, so a slow or rebooting
+    # controller does not hold up startup; otherwise wait for a live poll
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await async_setup_device_registry(hass, entry.entry_id)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {host}"
+        )
     return True
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator.
+
+    Entities, listeners and data are kept; the sensor platform applies its
+    own options.
+    """
+    coordinator: MyAir3Coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_settings(**_coordinator_settings(hass, entry))
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Stops polling and closes the controller's connection pool
+        await coordinator.async_shutdown()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached state and snapshots of a deleted config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await Store(
+        hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshots"
+    ).async_remove()
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old config entries."""
     if config_entry.version == 1:
@@ -61,14 +273,170 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     return True
 
 
-class MyAir3Coordinator(DataUpdateCoordinator):
+def _scope(zone: int | None) -> int | str:
+    """Return the listener scope for a zone id, or the system for None."""
+    return SCOPE_SYSTEM if zone is None else zone
+
+
+def _replace_fields(
+    data: SystemState, zone: int | None, changes: dict[str, Any]
+) -> SystemState:
+    """Return data with system (zone None) or zone attributes replaced."""
+    if zone is None:
+        return replace(data, **changes)
+    target = data.zones.get(zone)
+    if target is None:
+        return data
+    return replace(data, zones={**data.zones, zone: replace(target, **changes)})
+
+
+def _param_matches(target: SystemState | ZoneState, param: str, value: Any) -> bool:
+    """Return whether target already has the value a write parameter sets."""
+    field = WRITE_PARAMS.get(param)
+    if field is None:
+        return False
+    current = getattr(target, field)
+    return type(current)(value) == current
+
+
+def _cancel_waiters(waiters: dict[int | None, list[asyncio.Future[bool]]]) -> None:
+    """Cancel command waiters that will never get a result."""
+    for target_waiters in waiters.values():
+        for waiter in target_waiters:
+            if not waiter.done():
+                waiter.cancel()
+
+
+class MyAir3Coordinator(DataUpdateCoordinator[SystemState]):
     """Fetches MyAir3 data."""
 
-    def __init__(self, hass: HomeAssistant, host: str, password: str, scan_interval: int = DEFAULT_SCAN_INTERVAL) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        password: str,
+        scan_interval: int = DEFAULT_SCAN_INTERVAL,
+        zone_concurrency: int = DEFAULT_ZONE_CONCURRENCY,
+        fast_scan_interval: int = DEFAULT_FAST_SCAN_INTERVAL,
+        fast_poll_window: int = DEFAULT_FAST_POLL_WINDOW,
+        idle_scan_interval: int = DEFAULT_IDLE_SCAN_INTERVAL,
+        command_debounce: float = COMMAND_DEBOUNCE,
+        optimistic: bool = DEFAULT_OPTIMISTIC,
+        zones_per_poll: int = DEFAULT_ZONES_PER_POLL,
+        zone_max_age: int = DEFAULT_ZONE_MAX_AGE,
+        request_limit: int = DEFAULT_REQUEST_LIMIT,
+        timeout_floor: float = DEFAULT_TIMEOUT_FLOOR,
+        timeout_ceiling: float = DEFAULT_TIMEOUT_CEILING,
+        store: Store | None = None,
+        snapshot_store: Store | None = None,
+        session: aiohttp.ClientSession | None = None,
+        dedicated_session: bool = False,
+        capture: CaptureWriter | None = None,
+    ) -> None:
+        """Initialize.
+
+        zone_concurrency caps the number of getZoneData requests in flight
+        during a poll. 1 fetches zones one at a time, 0 means unlimited.
+
+        request_limit caps the requests of any kind in flight to the
+        controller (0 = unlimited). Commands are sent ahead of queued poll
+        requests and may abort a running one, which is then retried.
+
+        Request timeouts follow each endpoint's recent latency, kept between
+        timeout_floor and timeout_ceiling seconds. get* requests are retried
+        and a controller that keeps failing is only probed occasionally, see
+        resilience.
+
+        scan_interval applies while the system is on. For fast_poll_window
+        seconds after a command the coordinator polls every
+        fast_scan_interval seconds instead, and while the system is off it
+        backs off to idle_scan_interval.
+
+        Commands are batched: writes issued within command_debounce seconds
+        of each other are merged and followed by a single refresh. With
+        optimistic set, acknowledged writes are applied to data directly and
+        the next scheduled poll confirms them instead.
+
+        zones_per_poll limits how many zones a poll refreshes (0 = all). The
+        system block is fetched every poll and zones rotate oldest first, so
+        every zone is refreshed at least every ceil(zones / zones_per_poll)
+        polls. Zones that were just written or changed on the wall panel
+        are fetched in addition, ahead of the rotation.
+
+        A zone that fails to fetch keeps its last good state and does not
+        fail the poll. Its entities go unavailable once that state is older
+        than zone_max_age seconds.
+
+        With a store, every successful poll is cached so the next startup
+        can begin from it, see async_restore. Named snapshots are kept in
+        snapshot_store.
+
+        session replaces Home Assistant's shared aiohttp session, for example
+        with a capture.ReplaySession. With dedicated_session the coordinator
+        opens its own keep-alive connection pool to the controller instead
+        and closes it in async_shutdown. With capture, every exchange with
+        the controller is appended to a capture file.
+        """
         self.host = host
         self.password = password
-        self.session = async_get_clientsession(hass)
+        self.zone_concurrency = zone_concurrency
+        self.scan_interval = scan_interval
+        self.fast_scan_interval = fast_scan_interval
+        self.fast_poll_window = fast_poll_window
+        self.idle_scan_interval = idle_scan_interval
+        self._fast_poll_until = 0.0
+        self.optimistic = optimistic
+        self.zones_per_poll = zones_per_poll
+        self._poll_count = 0
+        self._zone_polled: dict[int, int] = {}
+        self._priority_zones: set[int] = set()
+        self.zone_max_age = zone_max_age
+        self.zone_updated: dict[int, float] = {}
+        self.zone_missing_polls: dict[int, int] = {}
+        self._failing_zones: set[int] = set()
+        self._zone_availability: dict[int, bool] = {}
+        self._store = store
+        self.restored = False
+        self._snapshot_store = snapshot_store
+        self.snapshots: dict[str, dict[str, Any]] = {}
+        self._pending_writes: dict[int | None, dict[str, Any]] = {}
+        self._expected: dict[tuple[int | None, str], tuple[Any, float]] = {}
+        self._pending_waiters: dict[int | None, list[asyncio.Future[bool]]] = {}
+        self.command_debounce = command_debounce
+        self._flush_task: asyncio.Task[None] | None = None
+        self.metrics = CoordinatorMetrics()
+        self._owns_session = session is None and dedicated_session
+        if session is not None:
+            self.session = session
+        elif dedicated_session:
+            self.session = _create_controller_session(
+                request_limit, self.metrics.connections
+            )
+        else:
+            self.session = async_get_clientsession(hass)
+        self._unsub_stop: CALLBACK_TYPE | None = None
+        if self._owns_session:
+            self._unsub_stop = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop
+            )
+        self.capture = capture
+        self.scheduler = RequestScheduler(request_limit)
+        self.parse_cache = ParseCache()
+        self._polled: tuple[SystemState, SystemState] | None = None
+        self.timeouts = AdaptiveTimeouts(timeout_floor, timeout_ceiling)
+        self.breaker = CircuitBreaker()
+        self.retry_count = 0
+        self.relogin_count = 0
+        self.listener_updates = 0
+        self.listener_updates_skipped = 0
+        self._changed: set[tuple[int | str, str]] | None = None
+        self._notified_success = True
+        self.last_session_duration: float | None = None
+        self._session_started: float | None = None
+        # Bumped on every login, so a request can tell whether the session it
+        # was sent with is still the current one
+        self._session_generation = 0
+        self._login_lock = asyncio.Lock()
         super().__init__(
             hass,
             _LOGGER,
@@ -76,117 +444,876 @@ class MyAir3Coordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=scan_interval),
         )
 
-    async def _async_update_data(self):
+    @callback
+    def async_apply_settings(
+        self,
+        *,
+        password: str,
+        scan_interval: int,
+        zone_concurrency: int,
+        fast_scan_interval: int,
+        fast_poll_window: int,
+        idle_scan_interval: int,
+        optimistic: bool,
+        zones_per_poll: int,
+        zone_max_age: int,
+        request_limit: int,
+        timeout_floor: float,
+        timeout_ceiling: float,
+        capture: CaptureWriter | None,
+    ) -> None:
+        """Change settings in place, keeping data and listeners.
+
+        A new password forgets the controller session so the next request
+        logs in with it. The polling tier is picked again straight away.
+        The connection pool keeps the size it was created with.
+        """
+        if password != self.password:
+            self.password = password
+            self._expire_session()
+        self.scan_interval = scan_interval
+        self.zone_concurrency = zone_concurrency
+        self.fast_scan_interval = fast_scan_interval
+        self.fast_poll_window = fast_poll_window
+        self.idle_scan_interval = idle_scan_interval
+        self.optimistic = optimistic
+        self.zones_per_poll = zones_per_poll
+        self.zone_max_age = zone_max_age
+        self.scheduler.set_limit(request_limit)
+        self.timeouts.floor = timeout_floor
+        self.timeouts.ceiling = max(timeout_floor, timeout_ceiling)
+        if capture is None or self.capture is None or capture.path != self.capture.path:
+            self.capture = capture
+        if self.data is not None:
+            self._async_reschedule()
+
+    async def _async_update_data(self) -> SystemState:
+        """Fetch system data and zones, recording how long the poll took."""
+        started = time.monotonic()
+        try:
+            data = await self._async_poll(started)
+        except Exception:
+            self.metrics.record_poll(time.monotonic() - started, False, dt_util.utcnow())
+            raise
+        self.metrics.record_poll(time.monotonic() - started, True, dt_util.utcnow())
+        if self.restored:
+            # Entities drop their assumed state, so wake all of them
+            self.restored = False
+            self._changed = None
+        if self._store is not None:
+            self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+        return data
+
+    async def async_restore(self) -> bool:
+        """Load the cached state as data and return whether there was one.
+
+        Restored data stays marked as restored until the first live poll
+        succeeds.
+        """
+        if self._store is None or not (cached := await self._store.async_load()):
+            return False
+        try:
+            self.data = state_from_dict(cached)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring unusable cached state for %s: %s", self.host, err)
+            return False
+        self.restored = True
+        return True
+
+    @callback
+    def _cache_data(self) -> dict[str, Any]:
+        """Return data for the state cache."""
+        return state_as_dict(self.data)
+
+    async def _async_poll(self, started: float) -> SystemState:
         """Fetch system data and all zones."""
         try:
-            await self._fetch_xml(f"http://{self.host}/login?password={self.password}")
+            system, num_zones = await self._fetch_system()
+            zone_ids = self._select_zones(num_zones)
+            fetched = await self._fetch_zones(zone_ids, isolate=True)
+        except (
+            OSError,
+            ValueError,
+            aiohttp.ClientError,
+            TimeoutError,
+        ) as err:
+            raise UpdateFailed(f"Error: {err}") from err
+
+        self._poll_count += 1
+        self._track_polled_zones(fetched)
+        previous = self.data.zones if self.data is not None else {}
+        zones = {}
+        for zone_id in range(1, num_zones + 1):
+            zone = fetched.get(zone_id) or previous.get(zone_id)
+            if zone is not None:
+                zones[zone_id] = zone
+        zones_expired = self._count_missing_zones(zones)
+        if self.data is not None and zones.keys() != self.data.zones.keys():
+            self._forget_zones(self.data.zones.keys() - zones.keys())
+            _LOGGER.info("Controller %s now reports zones %s", self.host, sorted(zones))
+        if self._is_unchanged(system, zones):
+            # Every response matched the last poll's, so keep the same data
+            data = self.data
+        else:
+            data = replace(system, zones=zones)
+        self._polled = (system, data)
+        data = self._verify_expected(data, started, {SCOPE_SYSTEM, *zone_ids})
+        availability = self._availability_changes(data)
+        if self.data is None:
+            self._changed = None
+        elif data is self.data:
+            self._changed = availability
+        else:
+            self._changed = changed_keys(self.data, data) | availability
+        if zones_expired and self._changed is not None:
+            self._changed.add((SCOPE_SYSTEM, ZONE_TOPOLOGY))
+        self._select_update_interval(data)
+        return data
+
+    def _is_unchanged(self, system: SystemState, zones: dict[int, ZoneState]) -> bool:
+        """Return whether a poll produced exactly the objects data was built from.
+
+        The parse cache hands back the same objects for unchanged responses,
+        so identity checks are enough. data must not have been changed since
+        the last poll, for example by an optimistic write.
+        """
+        if self._polled is None or self.data is not self._polled[1]:
+            return False
+        previous = self.data.zones
+        return (
+            system is self._polled[0]
+            and len(zones) == len(previous)
+            and all(previous.get(zone_id) is zone for zone_id, zone in zones.items())
+        )
+
+    async def async_refresh_partial(
+        self, system: bool = False, zone_ids: Iterable[int] = ()
+    ) -> None:
+        """Refetch only the system block and/or the given zones.
+
+        The result is merged into data and only listeners of values that
+        changed are notified. Falls back to a full refresh if there is no
+        data yet or the partial fetch fails.
+        """
+        zone_ids = sorted(zone_ids)
+        if self.data is None:
+            await self.async_refresh()
+            return
+        started = time.monotonic()
+        try:
+            new_system = (await self._fetch_system())[0] if system else self.data
+            zones = await self._fetch_zones(zone_ids)
+        except (
+            OSError,
+            ValueError,
+            aiohttp.ClientError,
+            TimeoutError,
+            UpdateFailed,
+        ) as err:
+            _LOGGER.debug("Partial refresh failed, refreshing everything: %s", err)
+            await self.async_refresh()
+            return
+        self._track_polled_zones(zones)
+
+        data = replace(new_system, zones={**self.data.zones, **zones})
+        scopes: set[Any] = set(zone_ids)
+        if system:
+            scopes.add(SCOPE_SYSTEM)
+        data = self._verify_expected(data, started, scopes)
+        self._async_set_data(data)
+        self._async_reschedule()
+
+    def _select_zones(self, num_zones: int) -> list[int]:
+        """Pick the zones to fetch this poll, priority zones first."""
+        zone_ids = range(1, num_zones + 1)
+        if not self.zones_per_poll or self.data is None or self.restored:
+            return list(zone_ids)
+        known = self.data.zones
+        priority = [
+            zone_id
+            for zone_id in zone_ids
+            if zone_id in self._priority_zones
+            or zone_id in self._pending_writes
+            or zone_id not in known
+        ]
+        rotation = sorted(
+            (zone_id for zone_id in zone_ids if zone_id not in priority),
+            key=lambda zone_id: self._zone_polled.get(zone_id, -1),
+        )
+        return priority + rotation[: self.zones_per_poll]
+
+    def _count_missing_zones(self, zones: dict[int, ZoneState]) -> bool:
+        """Count the successful polls each vanished zone has been missing from.
+
+        Returns whether a zone has now been missing for ZONE_REMOVAL_POLLS
+        polls, so zone entity tracking can delete its registry entries.
+        """
+        known = self.data.zones.keys() if self.data is not None else set()
+        expired = False
+        for zone_id in known | self.zone_missing_polls.keys():
+            if zone_id in zones:
+                self.zone_missing_polls.pop(zone_id, None)
+                continue
+            missing = self.zone_missing_polls.get(zone_id, 0) + 1
+            self.zone_missing_polls[zone_id] = missing
+            expired |= missing == ZONE_REMOVAL_POLLS
+        return expired
+
+    def _forget_zones(self, zone_ids: Iterable[int]) -> None:
+        """Drop the polling state of zones the controller no longer reports."""
+        for zone_id in zone_ids:
+            self._zone_polled.pop(zone_id, None)
+            self.zone_updated.pop(zone_id, None)
+            self._failing_zones.discard(zone_id)
+            self._priority_zones.discard(zone_id)
+
+    def _track_polled_zones(self, fetched: dict[int, ZoneState]) -> None:
+        """Record when zones were fetched and which to promote next poll.
 
-            sys_xml = await self._fetch_xml(f"http://{self.host}/getSystemData")
-            sys_root = fromstring(sys_xml.encode("utf-8"))
-            unitcontrol = sys_root.find(".//unitcontrol")
+        A zone whose power or setpoint changed since its last fetch is being
+        adjusted (from the wall panel or a command) and is fetched again on
+        the next poll.
+        """
+        previous = self.data.zones if self.data is not None else {}
+        now = time.monotonic()
+        for zone_id, zone in fetched.items():
+            self._zone_polled[zone_id] = self._poll_count
+            self.zone_updated[zone_id] = now
+            self._failing_zones.discard(zone_id)
+            old = previous.get(zone_id)
+            if old is not None and (
+                old.setting != zone.setting or old.desired_temp != zone.desired_temp
+            ):
+                self._priority_zones.add(zone_id)
+            else:
+                self._priority_zones.discard(zone_id)
 
-            if unitcontrol is None:
-                raise UpdateFailed("No unitcontrol data in response")
+    @callback
+    def async_add_zone_entities(
+        self,
+        create_entities: Callable[[int], list[Entity]],
+        async_add_entities: AddEntitiesCallback,
+    ) -> CALLBACK_TYPE:
+        """Keep a platform's zone entities in step with the reported zones.
 
-            num_zones = int(unitcontrol.findtext("numberOfZones", "0") or "0")
+        create_entities(zone_id) is called for every zone in data now and for
+        each zone that appears later, and the entities are added. Entities of
+        a zone that disappears are removed from Home Assistant but keep their
+        registry entries, so a zone missing from a poll or two (for example
+        while the controller restarts) comes back with its customisations.
+        Once the zone has been missing for ZONE_REMOVAL_POLLS successful polls
+        in a row the registry entries are deleted too. When a zone is
+        renamed, each of its entities' async_set_zone_name is called.
+        Returns a callback that stops tracking.
+        """
+        zone_entities: dict[int, list[Entity]] = {}
+        zone_names: dict[int, str] = {}
+        # Entity ids of removed zones whose registry entries are kept for now
+        removed: dict[int, list[str]] = {}
 
-            zones = {}
-            for zone_id in range(1, num_zones + 1):
-                zone_xml = await self._fetch_xml(
-                    f"http://{self.host}/getZoneData?zone={zone_id}"
+        @callback
+        def async_check_zones() -> None:
+            zones = self.data.zones if self.data is not None else {}
+            new_entities: list[Entity] = []
+            for zone_id in zones.keys() - zone_entities.keys():
+                removed.pop(zone_id, None)
+                zone_entities[zone_id] = create_entities(zone_id)
+                zone_names[zone_id] = zones[zone_id].name
+                new_entities.extend(zone_entities[zone_id])
+            for zone_id in zone_entities.keys() - zones.keys():
+                del zone_names[zone_id]
+                removed[zone_id] = []
+                for entity in zone_entities.pop(zone_id):
+                    if entity.hass is None:
+                        continue
+                    removed[zone_id].append(entity.entity_id)
+                    self.hass.async_create_task(entity.async_remove())
+            registry = er.async_get(self.hass)
+            for zone_id in list(removed):
+                if self.zone_missing_polls.get(zone_id, 0) >= ZONE_REMOVAL_POLLS:
+                    for entity_id in removed.pop(zone_id):
+                        if registry.async_get(entity_id) is not None:
+                            registry.async_remove(entity_id)
+            for zone_id, name in zone_names.items():
+                if zones[zone_id].name != name:
+                    zone_names[zone_id] = zones[zone_id].name
+                    for entity in zone_entities[zone_id]:
+                        entity.async_set_zone_name(zones[zone_id].name)
+            if new_entities:
+                async_add_entities(new_entities)
+
+        async_check_zones()
+        return self.async_add_listener(async_check_zones, system_keys(ZONE_TOPOLOGY))
+
+    def zone_available(self, zone_id: int) -> bool:
+        """Return whether a zone's state is fresh enough to show."""
+        return self._is_zone_available(self.data, zone_id)
+
+    def _is_zone_available(self, data: SystemState | None, zone_id: int) -> bool:
+        """Return whether a zone in data is known and not stale.
+
+        A zone skipped by tiered polling is not stale; only a zone whose
+        fetches keep failing goes unavailable, once its last good state is
+        older than zone_max_age.
+        """
+        if data is None or zone_id not in data.zones:
+            return False
+        if zone_id not in self._failing_zones:
+            return True
+        updated = self.zone_updated.get(zone_id)
+        return updated is not None and time.monotonic() - updated <= self.zone_max_age
+
+    def _availability_changes(self, data: SystemState) -> set[tuple[int, str]]:
+        """Return availability keys of zones that went (un)available."""
+        changed = set()
+        for zone_id in data.zones.keys() | self._zone_availability.keys():
+            available = self._is_zone_available(data, zone_id)
+            if self._zone_availability.get(zone_id) != available:
+                self._zone_availability[zone_id] = available
+                changed.add((zone_id, ZONE_AVAILABLE))
+        return changed
+
+    @callback
+    def _async_set_data(self, data: SystemState) -> None:
+        """Replace data outside a full refresh and notify what changed."""
+        previous, self.data = self.data, data
+        self._async_notify(
+            changed_keys(previous, data) | self._availability_changes(data)
+        )
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners after a full refresh.
+
+        Only listeners whose inputs changed are woken, unless availability
+        flipped or there is nothing to diff against, in which case all are.
+        """
+        changed, self._changed = self._changed, None
+        if self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            changed = None
+        self._async_notify(changed)
+
+    @callback
+    def _async_notify(self, changed: set[tuple[int | str, str]] | None) -> None:
+        """Notify the listeners whose context shares a key with changed.
+
+        Entities register with the (scope, attribute) keys they read as
+        listener context, see system_keys and zone_keys. Listeners added
+        without a context, and all listeners when changed is None, are
+        always notified.
+        """
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                self.listener_updates += 1
+                update_callback()
+            else:
+                self.listener_updates_skipped += 1
+
+    @callback
+    def _async_reschedule(self) -> None:
+        """Re-pick the polling tier and restart the refresh timer."""
+        self._select_update_interval(self.data)
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def _fetch_system(self) -> tuple[SystemState, int]:
+        """Fetch the system block and the number of zones."""
+        return self.parse_cache.parse(
+            "getSystemData",
+            None,
+            await self._fetch_xml(f"http://{self.host}/getSystemData"),
+            parse_system,
+        )
+
+    def _verify_expected(
+        self, data: SystemState, started: float, scopes: set[Any] | None = None
+    ) -> SystemState:
+        """Compare optimistic writes with what the controller now reports.
+
+        Only writes applied before this poll started, and within the
+        refreshed scopes (all of them for a full poll), are checked. The
+        polled data replaces the optimistic state either way, so a
+        disagreement rolls the write back.
+
+        Writes applied after the poll started may not be in its responses,
+        for example when a command preempted the poll, so they are laid over
+        the returned data and checked by the next poll.
+        """
+        newer: dict[int | None, dict[str, Any]] = {}
+        for key, (value, applied) in list(self._expected.items()):
+            zone, field = key
+            if applied > started:
+                newer.setdefault(zone, {})[field] = value
+                continue
+            if scopes is not None and _scope(zone) not in scopes:
+                continue
+            del self._expected[key]
+            target = data if zone is None else data.zones.get(zone)
+            if target is None or getattr(target, field) == value:
+                continue
+            _LOGGER.warning(
+                "Controller reports %s=%s%s after acknowledging %s, rolling back",
+                field,
+                getattr(target, field),
+                "" if zone is None else f" for zone {zone}",
+                value,
+            )
+        for zone, changes in newer.items():
+            data = _replace_fields(data, zone, changes)
+        return data
+
+    def _apply_optimistic(
+        self, data: SystemState, zone: int | None, params: dict[str, Any]
+    ) -> SystemState:
+        """Return data with an acknowledged write patched in."""
+        target = data if zone is None else data.zones.get(zone)
+        if target is None:
+            return data
+        changes: dict[str, Any] = {}
+        applied = time.monotonic()
+        for param, value in params.items():
+            field = WRITE_PARAMS.get(param)
+            if field is None:
+                continue
+            changes[field] = type(getattr(target, field))(value)
+            self._expected[(zone, field)] = (changes[field], applied)
+        return _replace_fields(data, zone, changes)
+
+    def _select_update_interval(self, data: SystemState) -> None:
+        """Pick the polling tier for the next refresh."""
+        if time.monotonic() < self._fast_poll_until:
+            seconds = self.fast_scan_interval
+        elif data.aircon_on_off == 1:
+            seconds = self.scan_interval
+        else:
+            seconds = self.idle_scan_interval
+        self.update_interval = timedelta(seconds=seconds)
+
+    async def _gather_limited(
+        self, coros: list[Coroutine[Any, Any, Any]], return_exceptions: bool = False
+    ) -> list[Any]:
+        """Await coroutines with at most zone_concurrency running at a time."""
+        semaphore = asyncio.Semaphore(self.zone_concurrency or len(coros) or 1)
+
+        async def run(coro: Coroutine[Any, Any, Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(
+            *(run(coro) for coro in coros), return_exceptions=return_exceptions
+        )
+
+    async def _fetch_zones(
+        self, zone_ids: Sequence[int], isolate: bool = False
+    ) -> dict[int, ZoneState]:
+        """Fetch zones, at most zone_concurrency requests at a time.
+
+        The result is keyed in zone order regardless of completion order, so
+        it is identical to fetching the zones one after another. With
+        isolate set, a zone that fails to fetch is marked as failing and
+        left out instead of failing the whole fetch. A zone missing from
+        its response is always marked as failing and left out.
+        """
+        results = await self._gather_limited(
+            [self._fetch_zone(zone_id) for zone_id in zone_ids],
+            return_exceptions=isolate,
+        )
+        zones = {}
+        for zone_id, result in zip(zone_ids, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _LOGGER.debug(
+                    "Fetching zone %s failed, keeping its last state: %s",
+                    zone_id,
+                    result,
                 )
-                zone_root = fromstring(zone_xml.encode("utf-8"))
-                zone_elem = zone_root.find(f".//zone{zone_id}")
-                if zone_elem is not None:
-                    has_low_batt = (
-                        int(zone_elem.findtext("hasLowBatt", "0") or "0") == 1
-                    )
-                    zones[zone_id] = {
-                        "name": zone_elem.findtext("name", f"Zone {zone_id}")
-                        or f"Zone {zone_id}",
-                        "setting": int(zone_elem.findtext("setting", "0") or "0"),
-                        "desiredTemp": float(
-                            zone_elem.findtext("desiredTemp", "20") or "20"
-                        ),
-                        "actualTemp": float(
-                            zone_elem.findtext("actualTemp", "20") or "20"
-                        ),
-                        "userPercentSetting": int(
-                            zone_elem.findtext("userPercentSetting", "0") or "0"
-                        ),
-                        "hasLowBatt": has_low_batt,
-                        "tempSensorAvailable": not has_low_batt,
-                    }
-
-            return {
-                "airconOnOff": int(unitcontrol.findtext("airconOnOff", "0") or "0"),
-                "mode": int(unitcontrol.findtext("mode", "1") or "1"),
-                "fanSpeed": int(unitcontrol.findtext("fanSpeed", "1") or "1"),
-                "centralDesiredTemp": float(
-                    unitcontrol.findtext("centralDesiredTemp", "20") or "20"
-                ),
-                "centralActualTemp": float(
-                    unitcontrol.findtext("centralActualTemp", "20") or "20"
+                self._failing_zones.add(zone_id)
+            elif result is None:
+                # Answered without the zone: age it out like a failed fetch
+                _LOGGER.debug("Zone %s missing from getZoneData response", zone_id)
+                self._failing_zones.add(zone_id)
+            else:
+                zones[zone_id] = result
+        return zones
+
+    async def _fetch_zone(self, zone_id: int) -> ZoneState | None:
+        """Fetch and parse a single zone."""
+        return self.parse_cache.parse(
+            "getZoneData",
+            zone_id,
+            await self._fetch_xml(f"http://{self.host}/getZoneData?zone={zone_id}"),
+            partial(parse_zone, zone_id=zone_id),
+        )
+
+    async def _async_login(self, priority: int = PRIORITY_POLL) -> None:
+        """Start a new controller session."""
+        await self._request(
+            f"http://{self.host}/login?password={self.password}", priority
+        )
+        self._session_started = time.monotonic()
+        self._session_generation += 1
+
+    async def _async_ensure_session(self, priority: int = PRIORITY_POLL) -> int:
+        """Log in unless a session is open and return the session generation.
+
+        Concurrent callers without a session share a single login.
+        """
+        if self._session_started is None:
+            async with self._login_lock:
+                if self._session_started is None:
+                    await self._async_login(priority)
+        return self._session_generation
+
+    def _expire_session(self) -> None:
+        """Forget the current session and record how long it lasted."""
+        if self._session_started is not None:
+            self.last_session_duration = time.monotonic() - self._session_started
+            _LOGGER.debug(
+                "Session on %s expired after %.0fs",
+                self.host,
+                self.last_session_duration,
+            )
+        self._session_started = None
+
+    async def _fetch_xml(self, url: str, priority: int = PRIORITY_POLL) -> bytes:
+        """Fetch and return XML response, logging in only when needed."""
+        generation = await self._async_ensure_session(priority)
+        try:
+            return await self._request(url, priority)
+        except SessionExpired:
+            # Requests sent with a session that was already replaced are
+            # just retried, so each expiry is counted and timed once
+            if (
+                generation == self._session_generation
+                and self._session_started is not None
+            ):
+                self._expire_session()
+                self.relogin_count += 1
+            await self._async_ensure_session(priority)
+            return await self._request(url, priority)
+
+    async def _request(self, url: str, priority: int = PRIORITY_POLL) -> bytes:
+        """Perform a single request through the scheduler.
+
+        Idempotent get* requests are retried with jittered backoff after a
+        timeout, connection error or server error. Fails straight away with
+        ControllerUnavailable while the circuit breaker is open. Only
+        requests the controller did not answer count against the breaker.
+        """
+        if not self.breaker.allow():
+            raise ControllerUnavailable(
+                f"{self.host} failed {self.breaker.failures} requests in a row"
+            )
+        endpoint = urlsplit(url).path.lstrip("/")
+        retries = RETRY_ATTEMPTS if endpoint.startswith("get") else 0
+        attempt = 0
+        while True:
+            try:
+                body = await self.scheduler.run(
+                    priority,
+                    partial(self._send_request, url, self.timeouts.timeout(endpoint)),
+                )
+            except (TimeoutError, aiohttp.ClientError, ServerError) as err:
+                if attempt == retries:
+                    self._record_breaker(err)
+                    raise
+                self.retry_count += 1
+                _LOGGER.debug("Retrying %s after %r", endpoint, err)
+                await asyncio.sleep(backoff_delay(attempt))
+                attempt += 1
+            except Exception as err:
+                self._record_breaker(err)
+                raise
+            else:
+                self.breaker.record_success()
+                return body
+
+    def _record_breaker(self, err: Exception) -> None:
+        """Tell the circuit breaker how a failed request ended.
+
+        A request that got an HTTP status back (an error status or an
+        expired session) shows the controller is reachable. Only timeouts
+        and connection errors count as failures.
+        """
+        if isinstance(err, (TimeoutError, aiohttp.ClientConnectionError)):
+            self.breaker.record_failure()
+        elif isinstance(err, UpdateFailed):
+            self.breaker.record_success()
+
+    async def _send_request(self, url: str, timeout: float) -> bytes:
+        """Perform a single request and return the raw XML response."""
+        started = time.monotonic()
+        body = b""
+        status: int | None = None
+        error: BaseException | None = None
+        failed = True
+        try:
+            async with self.session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(
+                    total=timeout,
+                    sock_connect=min(timeout, REQUEST_TIMEOUT.sock_connect),
                 ),
-                "zones": zones,
-            }
-        except (OSError, ValueError) as err:
-            raise UpdateFailed(f"Error: {err}") from err
+            ) as resp:
+                status = resp.status
+                body = await resp.read()
+            if status in SESSION_EXPIRED_STATUSES:
+                raise SessionExpired(f"HTTP {status}")
+            if status >= 500:
+                raise ServerError(f"HTTP {status}")
+            if status != 200:
+                raise UpdateFailed(f"HTTP {status}")
+            if SESSION_EXPIRED_MARKER in body:
+                raise SessionExpired("Controller reported an expired session")
+            failed = False
+            self.timeouts.record(
+                urlsplit(url).path.lstrip("/"), time.monotonic() - started
+            )
+            return body
+        except asyncio.CancelledError:
+            # Aborted in favour of a command, not a controller error
+            failed = False
+            raise
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            self.metrics.endpoint(urlsplit(url).path.lstrip("/")).record(
+                elapsed, len(body), failed
+            )
+            if self.capture is not None and (status is not None or error):
+                self.capture.record(url, started, elapsed, status, body, error)
 
-    async def _fetch_xml(self, url: str) -> str:
-        """Fetch and return XML response."""
-        async with self.session.get(
-            url, timeout=aiohttp.ClientTimeout(total=10)
-        ) as resp:
-            if resp.status != 200:
-                raise UpdateFailed(f"HTTP {resp.status}")
-            return await resp.text()
-
-    async def _async_set_data(self, url: str, description: str) -> None:
-        """Send command and refresh data."""
-        resp = await self._fetch_xml(url)
-        if "<ack>1</ack>" in resp:
-            await self.async_refresh()
+    async def _async_queue_command(
+        self,
+        params: dict[str, Any],
+        zone: int | None = None,
+        defaults: dict[str, Any] | None = None,
+    ) -> bool:
+        """Queue a write and wait for the batch it is sent in.
+
+        Writes queued within the debounce window are merged per target, so
+        system parameters go out as one setSystemData request and each zone
+        gets at most one setZoneData request. A later write to the same field
+        replaces an earlier pending one. defaults only fill fields that no
+        pending write has set. Returns whether the controller acknowledged.
+        """
+        pending = self._pending_writes.setdefault(zone, {})
+        for key, value in (defaults or {}).items():
+            pending.setdefault(key, value)
+        pending.update(params)
+        waiter = self.hass.loop.create_future()
+        self._pending_waiters.setdefault(zone, []).append(waiter)
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_run_flushes(), f"{DOMAIN} commands {self.host}"
+            )
+        return await waiter
+
+    async def _async_run_flushes(self) -> None:
+        """Flush pending writes in batches until none are left.
+
+        Each batch collects the writes queued within command_debounce
+        seconds. Writes queued while a batch is being sent go out in the
+        next one, so no command is left waiting.
+        """
+        try:
+            while self._pending_writes:
+                await asyncio.sleep(self.command_debounce)
+                try:
+                    await self._async_flush_commands()
+                except Exception:
+                    _LOGGER.exception("Unexpected error sending commands")
+        finally:
+            self._flush_task = None
+
+    async def _async_flush_commands(self) -> None:
+        """Send the pending writes and refresh once for the whole batch.
+
+        Only the system block and zones that were written are refetched. In
+        optimistic mode acknowledged targets are not refetched at all, since
+        data already holds the written values.
+        """
+        writes, self._pending_writes = self._pending_writes, {}
+        waiters, self._pending_waiters = self._pending_waiters, {}
+        if not writes:
+            return
+        self._fast_poll_until = time.monotonic() + self.fast_poll_window
+        self._priority_zones.update(target for target in writes if target is not None)
+        targets = list(writes)
+        results: list[Any] = []
+        try:
+            results = await self._gather_limited(
+                [self._async_send_write(target, writes[target]) for target in targets],
+                return_exceptions=True,
+            )
+            stale = set(targets)
+            if self.optimistic and self.data is not None:
+                data = self.data
+                for target, result in zip(targets, results):
+                    if result is True:
+                        data = self._apply_optimistic(data, target, writes[target])
+                        stale.discard(target)
+                self._async_set_data(data)
+                # Bring the confirming poll forward to the fast interval
+                self._async_reschedule()
+            if stale:
+                await self.async_refresh_partial(
+                    system=None in stale,
+                    zone_ids=[target for target in stale if target is not None],
+                )
+        finally:
+            for target, result in zip(targets, results):
+                for waiter in waiters.pop(target):
+                    if waiter.done():
+                        # The caller was cancelled while waiting
+                        continue
+                    if isinstance(result, BaseException):
+                        waiter.set_exception(result)
+                    else:
+                        waiter.set_result(result)
+            _cancel_waiters(waiters)
+
+    async def _async_send_write(self, zone: int | None, params: dict[str, Any]) -> bool:
+        """Send one merged write and return whether it was acknowledged."""
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        if zone is None:
+            path = f"setSystemData?{query}"
         else:
-            _LOGGER.warning("ack not returned for %s", description)
-            await self.async_request_refresh()
+            path = f"setZoneData?zone={zone}&{query}"
+        body = await self._fetch_xml(f"http://{self.host}/{path}", PRIORITY_COMMAND)
+        if is_acknowledged(body):
+            return True
+        _LOGGER.warning("ack not returned for %s", path)
+        return False
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending commands and stop polling."""
+        await super().async_shutdown()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        _cancel_waiters(self._pending_waiters)
+        self._pending_waiters = {}
+        self._pending_writes = {}
+        await self.async_close_session()
+
+    async def async_close_session(self) -> None:
+        """Close the controller session if this coordinator created it."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._owns_session:
+            await self.session.close()
+
+    async def _async_stop(self, _event: Event) -> None:
+        """Close the controller session when Home Assistant stops."""
+        self._unsub_stop = None
+        await self.async_close_session()
 
     async def set_system_power(self, power: int) -> None:
         """Turn system on/off. 0=off, 1=on."""
-        await self._async_set_data(
-            f"http://{self.host}/setSystemData?airconOnOff={power}", "set_system_power"
-        )
+        await self._async_queue_command({"airconOnOff": power})
 
     async def set_system_temp(self, temp: float) -> None:
         """Set system target temperature."""
-        await self._async_set_data(
-            f"http://{self.host}/setSystemData?centralDesiredTemp={temp}",
-            "set_system_temp",
-        )
+        await self._async_queue_command({"centralDesiredTemp": temp})
 
     async def set_fan_speed(self, speed: int) -> None:
         """Set fan speed. 1=low, 2=medium, 3=high."""
-        await self._async_set_data(
-            f"http://{self.host}/setSystemData?fanSpeed={speed}", "set_fan_speed"
-        )
+        await self._async_queue_command({"fanSpeed": speed})
 
     async def set_zone_power(self, zone: int, power: int) -> None:
         """Turn zone on/off. 0=off, 1=on."""
-        await self._async_set_data(
-            f"http://{self.host}/setZoneData?zone={zone}&zoneSetting={power}",
-            "set_zone_power",
-        )
+        await self._async_queue_command({"zoneSetting": power}, zone)
 
     async def set_zone_temp(self, zone: int, temp: float) -> None:
         """Set zone target temperature."""
-        setting = self.data["zones"][zone]["setting"]
-        await self._async_set_data(
-            f"http://{self.host}/setZoneData?zone={zone}&desiredTemp={temp}&zoneSetting={setting}",
-            "set_zone_temp",
+        setting = self.data.zones[zone].setting
+        await self._async_queue_command(
+            {"desiredTemp": temp}, zone, defaults={"zoneSetting": setting}
+        )
+
+    async def set_zones(self, zones: dict[int, dict[str, Any]]) -> dict[int, bool]:
+        """Write several zones in one batch and return which were acknowledged.
+
+        zones maps zone ids to setZoneData parameters. Parameters the zone
+        already has are left out, and zones with nothing left to change are
+        reported as acknowledged without a request. The rest go out as one
+        batch, at most one setZoneData request per zone, followed by a
+        single refresh.
+        """
+        writes: dict[int, dict[str, Any]] = {}
+        for zone_id, params in zones.items():
+            zone = self.data.zones.get(zone_id)
+            # A queued write may still change a parameter, so keep those
+            pending = self._pending_writes.get(zone_id, {})
+            if changes := {
+                param: value
+                for param, value in params.items()
+                if zone is None
+                or param in pending
+                or not _param_matches(zone, param, value)
+            }:
+                writes[zone_id] = changes
+        results = await self._async_write_batch(writes) if writes else {}
+        return {zone_id: results.get(zone_id, True) for zone_id in zones}
+
+    async def _async_write_batch(
+        self, writes: dict[Any, dict[str, Any]]
+    ) -> dict[Any, bool]:
+        """Queue writes keyed by zone id (None = system) as one batch.
+
+        Zone writes keep the zone's current setting unless they change it.
+        Returns whether each target was acknowledged.
+        """
+        targets = list(writes)
+        results = await asyncio.gather(
+            *(
+                self._async_queue_command(
+                    writes[target],
+                    target,
+                    defaults=None
+                    if target is None
+                    else {"zoneSetting": self.data.zones[target].setting},
+                )
+                for target in targets
+            ),
+            return_exceptions=True,
+        )
+        acknowledged = {}
+        for target, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                _LOGGER.warning("Writing %s failed: %s", _scope(target), result)
+            acknowledged[target] = result is True
+        return acknowledged
+
+    async def async_load_snapshots(self) -> None:
+        """Load the saved snapshots."""
+        if self._snapshot_store is not None:
+            self.snapshots = await self._snapshot_store.async_load() or {}
+
+    async def snapshot(self, name: str) -> None:
+        """Save the current settings as a named snapshot."""
+        self.snapshots[name] = snapshot_params(self.data)
+        if self._snapshot_store is not None:
+            await self._snapshot_store.async_save(self.snapshots)
+
+    async def restore_snapshot(self, name: str) -> dict[int | None, bool]:
+        """Write back a named snapshot and return which writes were acknowledged.
+
+        Only settings that differ from data are written, all in one batch
+        followed by a single refresh. Results are keyed by zone id, None for
+        the system; nothing is sent if data already matches.
+        """
+        return await self._async_write_batch(
+            snapshot_writes(self.snapshots[name], self.data)
         )
 
     async def set_hvac_mode(self, mode: int) -> None:
         """Set system mode. 1=cool, 2=heat, 3=fan only."""
-        await self._async_set_data(
-            f"http://{self.host}/setSystemData?mode={mode}", "set_hvac_mode"
-        )
+        await self._async_queue_command({"mode": mode})
@@ -0,0 +1,144 @@
+"""Capture and replay of MyAir3 controller traffic.
+
+A capture is a JSON lines file with one exchange per line: the request
+path and query (password redacted), the response status, body and time
+taken, and when it started relative to the first exchange. ReplaySession
+serves a capture to MyAir3Coordinator in place of an aiohttp session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+import json
+from pathlib import Path
+import threading
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+REDACTED = "**REDACTED**"
+
+
+def capture_key(url: str) -> str:
+    """Return the path and query of url with the password redacted."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return parts.path
+    query = [
+        (key, REDACTED if key == "password" else value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return f"{parts.path}?{urlencode(query)}"
+
+
+class CaptureWriter:
+    """Append controller exchanges to a capture file."""
+
+    def __init__(self, hass: HomeAssistant, path: str | Path) -> None:
+        """Initialize."""
+        self._hass = hass
+        self.path = Path(path)
+        self._started: float | None = None
+        self._lock = threading.Lock()
+
+    @callback
+    def record(
+        self,
+        url: str,
+        started: float,
+        elapsed: float,
+        status: int | None,
+        body: bytes,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record one exchange; the file is written in the executor."""
+        if self._started is None:
+            self._started = started
+        exchange: dict[str, Any] = {
+            "t": round(started - self._started, 4),
+            "url": capture_key(url),
+            "elapsed": round(elapsed, 4),
+            "status": status,
+            "body": body.decode("utf-8", "surrogateescape"),
+        }
+        if error is not None:
+            exchange["error"] = type(error).__name__
+        line = json.dumps(exchange, separators=(",", ":")) + "\n"
+        self._hass.async_add_executor_job(self._write, line)
+
+    def _write(self, line: str) -> None:
+        """Append a line to the capture file."""
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(line)
+
+
+def load_capture(path: str | Path) -> list[dict[str, Any]]:
+    """Read a capture file in the order the exchanges started.
+
+    Does blocking I/O.
+    """
+    with Path(path).open(encoding="utf-8") as file:
+        exchanges = [json.loads(line) for line in file if line.strip()]
+    return sorted(exchanges, key=lambda exchange: exchange["t"])
+
+
+class _ReplayResponse:
+    """Async context manager standing in for an aiohttp response."""
+
+    def __init__(self, exchange: dict[str, Any], delay: float) -> None:
+        """Initialize."""
+        self._exchange = exchange
+        self._delay = delay
+        self.status: int = exchange["status"] or 0
+
+    async def __aenter__(self) -> _ReplayResponse:
+        """Wait for the recorded time, then answer or fail like the original."""
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        if (error := self._exchange.get("error")) is not None and not self.status:
+            if error == "TimeoutError":
+                raise TimeoutError
+            raise aiohttp.ClientConnectionError(f"Captured {error}")
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Nothing to release."""
+
+    async def read(self) -> bytes:
+        """Return the recorded body."""
+        return self._exchange["body"].encode("utf-8", "surrogateescape")
+
+
+class ReplaySession:
+    """Serve captured exchanges in place of an aiohttp.ClientSession.
+
+    Each request gets the next captured exchange for the same path and
+    query; once those run out the last one is repeated, so a capture of a
+    single poll can be replayed any number of times. With realtime set,
+    responses take as long as they originally did.
+    """
+
+    def __init__(
+        self, exchanges: Iterable[dict[str, Any]], realtime: bool = False
+    ) -> None:
+        """Initialize."""
+        self.realtime = realtime
+        self._exchanges: dict[str, deque[dict[str, Any]]] = {}
+        for exchange in exchanges:
+            self._exchanges.setdefault(exchange["url"], deque()).append(exchange)
+        self.requests = 0
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayResponse:
+        """Return the captured response for url."""
+        key = capture_key(url)
+        queue = self._exchanges.get(key)
+        if not queue:
+            raise aiohttp.ClientConnectionError(f"No captured response for {key}")
+        exchange = queue.popleft() if len(queue) > 1 else queue[0]
+        self.requests += 1
+        return _ReplayResponse(exchange, exchange["elapsed"] if self.realtime else 0)
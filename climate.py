@@ -1,5 +1,6 @@
 """Climate platform for MyAir3."""
 
+import asyncio
 import logging
 
 from homeassistant.components.climate import (
@@ -9,12 +10,13 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import MyAir3Coordinator
 from .const import DOMAIN, FAN_MODE_TO_MYAIR3, MODE_TO_MYAIR3
+from .models import system_keys, zone_keys
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,15 +29,15 @@ async def async_setup_entry(
     """Set up climate platform from config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    entities: list[ClimateEntity] = [MyAir3Climate(coordinator, config_entry.entry_id)]
-    zones = coordinator.data.get("zones", {})
-    entities.extend(
-        MyAir3Zone(coordinator, zone_id, config_entry.entry_id)
-        for zone_id in zones
+    async_add_entities([MyAir3Climate(coordinator, config_entry.entry_id)])
+    # Zone entities follow the zones the controller reports
+    config_entry.async_on_unload(
+        coordinator.async_add_zone_entities(
+            lambda zone_id: [MyAir3Zone(coordinator, zone_id, config_entry.entry_id)],
+            async_add_entities,
+        )
     )
 
-    async_add_entities(entities)
-
 
 class MyAir3Climate(ClimateEntity):
     """Main system climate entity."""
@@ -74,6 +76,11 @@ class MyAir3Climate(ClimateEntity):
         """
         return False
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing cached state from before a restart."""
+        return self.coordinator.restored
+
     @property
     def available(self) -> bool:
         """Return whether the entity is available."""
@@ -82,28 +89,29 @@ class MyAir3Climate(ClimateEntity):
     @property
     def current_temperature(self) -> float:
         """Return the current temperature."""
-        return self.coordinator.data["centralActualTemp"]
+        return self.coordinator.data.central_actual_temp
 
     @property
     def target_temperature(self) -> float:
         """Return the target temperature."""
-        return self.coordinator.data["centralDesiredTemp"]
+        return self.coordinator.data.central_desired_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        if self.coordinator.data["airconOnOff"] == 0:
+        data = self.coordinator.data
+        if data.aircon_on_off == 0:
             return HVACMode.OFF
-        mode = self.coordinator.data["mode"]
         return {1: HVACMode.COOL, 2: HVACMode.HEAT, 3: HVACMode.FAN_ONLY}.get(
-            mode, HVACMode.OFF
+            data.mode, HVACMode.OFF
         )
 
     @property
     def fan_mode(self) -> str:
         """Return the current fan mode."""
-        speed = self.coordinator.data["fanSpeed"]
-        return {1: "low", 2: "medium", 3: "high"}.get(speed, "low")
+        return {1: "low", 2: "medium", 3: "high"}.get(
+            self.coordinator.data.fan_speed, "low"
+        )
 
     async def async_set_temperature(self, **kwargs):
         """Set target temperature."""
@@ -120,15 +128,17 @@ class MyAir3Climate(ClimateEntity):
             return
 
         # 2. Handle other modes (COOL, HEAT, FAN_ONLY)
-        # First, ensure the power is ON if it was OFF
-        current_power = self.coordinator.data.get("airconOnOff", 0)
-        if current_power == 0:
-            await self.coordinator.set_system_power(1)
+        # Power on (if it was OFF) and set the mode together, so the
+        # coordinator merges them into a single setSystemData request
+        commands = []
+        if self.coordinator.data.aircon_on_off == 0:
+            commands.append(self.coordinator.set_system_power(1))
 
-        # Then, set the mode
         myair3_mode = MODE_TO_MYAIR3.get(hvac_mode)
         if myair3_mode is not None:
-            await self.coordinator.set_hvac_mode(myair3_mode)
+            commands.append(self.coordinator.set_hvac_mode(myair3_mode))
+
+        await asyncio.gather(*commands)
 
     async def async_set_fan_mode(self, fan_mode: str):
         """Set fan mode."""
@@ -139,7 +149,9 @@ class MyAir3Climate(ClimateEntity):
     async def async_added_to_hass(self):
         """Connect to coordinator."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(
+                self.async_write_ha_state, system_keys()
+            )
         )
 
 
@@ -164,9 +176,8 @@ class MyAir3Zone(ClimateEntity):
         self.coordinator = coordinator
         self._zone_id = zone_id
         self._entry_id = entry_id
-        zones = coordinator.data.get("zones", {})
-        zone_name = zones.get(zone_id, {}).get("name", f"Zone {zone_id}")
-        self._attr_name = zone_name
+        zone = coordinator.data.zones.get(zone_id)
+        self._attr_name = zone.name if zone else f"Zone {zone_id}"
         self._attr_unique_id = f"{coordinator.host}_zone_{zone_id}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.host)},
@@ -180,38 +191,51 @@ class MyAir3Zone(ClimateEntity):
         """No polling needed, coordinator handles updates."""
         return False
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing cached state from before a restart."""
+        return self.coordinator.restored
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return self.coordinator.last_update_success and (
+            self.coordinator.zone_available(self._zone_id)
+        )
+
+    @callback
+    def async_set_zone_name(self, name: str) -> None:
+        """Follow a zone renamed on the controller."""
+        self._attr_name = name
+        self.async_write_ha_state()
 
     @property
     def current_temperature(self) -> float:
         """Return the current temperature."""
-        zone = self.coordinator.data["zones"][self._zone_id]
+        zone = self.coordinator.data.zones[self._zone_id]
         # If temp sensor unavailable, use damper % as proxy (0-100 maps to 15-30°C range)
-        if not zone.get("tempSensorAvailable", True):
-            damper = zone["userPercentSetting"]
+        if not zone.temp_sensor_available:
+            damper = zone.user_percent_setting
             return 15 + (damper / 100 * 15)  # Maps 0% to 15°C, 100% to 30°C
-        return zone["actualTemp"]
+        return zone.actual_temp
 
     @property
     def target_temperature(self) -> float:
         """Return the target temperature."""
-        zone = self.coordinator.data["zones"][self._zone_id]
+        zone = self.coordinator.data.zones[self._zone_id]
         # If temp sensor unavailable, show damper % mapped to temp range
-        if not zone.get("tempSensorAvailable", True):
-            damper = zone["userPercentSetting"]
+        if not zone.temp_sensor_available:
+            damper = zone.user_percent_setting
             return 15 + (damper / 100 * 15)
-        return zone["desiredTemp"]
+        return zone.desired_temp
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        zone = self.coordinator.data["zones"][self._zone_id]
-        if zone["setting"] == 0:
+        data = self.coordinator.data
+        if data.zones[self._zone_id].setting == 0:
             return HVACMode.OFF
-        system_mode = self.coordinator.data["mode"]
+        system_mode = data.mode
         return {1: HVACMode.COOL, 2: HVACMode.HEAT, 3: HVACMode.FAN_ONLY}.get(
             system_mode, HVACMode.FAN_ONLY
         )
@@ -230,5 +254,8 @@ class MyAir3Zone(ClimateEntity):
     async def async_added_to_hass(self):
         """Connect to coordinator."""
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(
+                self.async_write_ha_state,
+                system_keys("mode") | zone_keys(self._zone_id),
+            )
         )
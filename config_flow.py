@@ -2,40 +2,66 @@
 
 import logging
 
-import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
-from .const import DEFAULT_PASSWORD, DEFAULT_SCAN_INTERVAL
+from .const import (
+    CONF_CAPTURE,
+    CONF_DAMPER_DEADBAND,
+    CONF_FAST_POLL_WINDOW,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_IDLE_SCAN_INTERVAL,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_OPTIMISTIC,
+    CONF_REQUEST_LIMIT,
+    CONF_TEMP_DEADBAND,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    CONF_ZONE_CONCURRENCY,
+    CONF_ZONE_MAX_AGE,
+    CONF_ZONES_PER_POLL,
+    DEFAULT_CAPTURE,
+    DEFAULT_DAMPER_DEADBAND,
+    DEFAULT_FAST_POLL_WINDOW,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_IDLE_SCAN_INTERVAL,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PASSWORD,
+    DEFAULT_REQUEST_LIMIT,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DEFAULT_ZONE_CONCURRENCY,
+    DEFAULT_ZONE_MAX_AGE,
+    DEFAULT_ZONES_PER_POLL,
+)
+from .discovery import DEFAULT_PORT, async_discover, async_probe
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_VERSION = 2
 
+CONF_NETWORK = "network"
+CONF_PORT = "port"
+DEFAULT_NETWORK = "192.168.1.0/24"
+
 
 async def validate_host(hass: HomeAssistant, host: str, password: str) -> bool:
     """Validate connection to MyAir3 system."""
-    session = async_get_clientsession(hass)
-    try:
-        async with session.get(
-            f"http://{host}/login?password={password}",
-            timeout=aiohttp.ClientTimeout(total=10),
-        ) as resp:
-            if resp.status != 200:
-                return False
-
-        async with session.get(
-            f"http://{host}/getSystemData",
-            timeout=aiohttp.ClientTimeout(total=10),
-        ) as resp:
-            return resp.status == 200
-    except (TimeoutError, aiohttp.ClientError, OSError) as err:
-        _LOGGER.error("Failed to connect: %s", err)
-        return False
+    return await async_probe(async_get_clientsession(hass), host, password)
 
 
 class MyAir3ConfigFlow(config_entries.ConfigFlow, domain="myair3"):
@@ -43,12 +69,25 @@ class MyAir3ConfigFlow(config_entries.ConfigFlow, domain="myair3"):
 
     VERSION = CONFIG_VERSION
 
+    def __init__(self) -> None:
+        """Initialize."""
+        self._discovered: list[str] = []
+        self._password = DEFAULT_PASSWORD
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow handler."""
+        return MyAir3OptionsFlowHandler()
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
         errors = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
+            host = user_input.get(CONF_HOST, "").strip()
+            if not host:
+                return await self.async_step_scan()
 
             await self.async_set_unique_id(host)
             self._abort_if_unique_id_configured()
@@ -69,7 +108,7 @@ class MyAir3ConfigFlow(config_entries.ConfigFlow, domain="myair3"):
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HOST): str,
+                    vol.Optional(CONF_HOST): str,
                     vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
                 }
             ),
@@ -79,6 +118,68 @@ class MyAir3ConfigFlow(config_entries.ConfigFlow, domain="myair3"):
             },
         )
 
+    async def async_step_scan(self, user_input=None):
+        """Scan a network for controllers."""
+        errors = {}
+
+        if user_input is not None:
+            self._password = user_input.get(CONF_PASSWORD, DEFAULT_PASSWORD)
+            try:
+                self._discovered = await async_discover(
+                    async_get_clientsession(self.hass),
+                    user_input[CONF_NETWORK],
+                    user_input.get(CONF_PORT, DEFAULT_PORT),
+                    self._password,
+                    exclude=self._async_current_ids(),
+                )
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if self._discovered:
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NETWORK, default=DEFAULT_NETWORK): str,
+                    vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.All(
+                        vol.Coerce(int), vol.Range(min=1, max=65535)
+                    ),
+                    vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(self, user_input=None):
+        """Pick one of the controllers found by the scan."""
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            await self.async_set_unique_id(host)
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=f"MyAir3 ({host})",
+                data={
+                    CONF_HOST: host,
+                    CONF_PASSWORD: self._password,
+                },
+            )
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): SelectSelector(
+                        SelectSelectorConfig(
+                            options=self._discovered, mode=SelectSelectorMode.LIST
+                        )
+                    ),
+                }
+            ),
+        )
+
 
 class MyAir3OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow for MyAir3."""
@@ -96,7 +197,10 @@ class MyAir3OptionsFlowHandler(config_entries.OptionsFlow):
                 {
                     vol.Optional(
                         CONF_PASSWORD,
-                        default=self.config_entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD),
+                        default=self.config_entry.options.get(
+                            CONF_PASSWORD,
+                            self.config_entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD),
+                        ),
                     ): str,
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
@@ -104,6 +208,96 @@ class MyAir3OptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                         ),
                     ): vol.All(vol.Coerce(int), vol.Range(min=10, max=300)),
+                    vol.Optional(
+                        CONF_FAST_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_FAST_SCAN_INTERVAL, DEFAULT_FAST_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=2, max=60)),
+                    vol.Optional(
+                        CONF_FAST_POLL_WINDOW,
+                        default=self.config_entry.options.get(
+                            CONF_FAST_POLL_WINDOW, DEFAULT_FAST_POLL_WINDOW
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                    vol.Optional(
+                        CONF_IDLE_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_IDLE_SCAN_INTERVAL, DEFAULT_IDLE_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Optional(
+                        CONF_ZONE_CONCURRENCY,
+                        default=self.config_entry.options.get(
+                            CONF_ZONE_CONCURRENCY, DEFAULT_ZONE_CONCURRENCY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    vol.Optional(
+                        CONF_REQUEST_LIMIT,
+                        default=self.config_entry.options.get(
+                            CONF_REQUEST_LIMIT, DEFAULT_REQUEST_LIMIT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    vol.Optional(
+                        CONF_TIMEOUT_FLOOR,
+                        default=self.config_entry.options.get(
+                            CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                    vol.Optional(
+                        CONF_TIMEOUT_CEILING,
+                        default=self.config_entry.options.get(
+                            CONF_TIMEOUT_CEILING, DEFAULT_TIMEOUT_CEILING
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                    vol.Optional(
+                        CONF_ZONES_PER_POLL,
+                        default=self.config_entry.options.get(
+                            CONF_ZONES_PER_POLL, DEFAULT_ZONES_PER_POLL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    vol.Optional(
+                        CONF_ZONE_MAX_AGE,
+                        default=self.config_entry.options.get(
+                            CONF_ZONE_MAX_AGE, DEFAULT_ZONE_MAX_AGE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_TEMP_DEADBAND,
+                        default=self.config_entry.options.get(
+                            CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_DAMPER_DEADBAND,
+                        default=self.config_entry.options.get(
+                            CONF_DAMPER_DEADBAND, DEFAULT_DAMPER_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=50)),
+                    vol.Optional(
+                        CONF_MIN_PUBLISH_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_MAX_PUBLISH_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                    vol.Optional(
+                        CONF_OPTIMISTIC,
+                        default=self.config_entry.options.get(
+                            CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_CAPTURE,
+                        default=self.config_entry.options.get(
+                            CONF_CAPTURE, DEFAULT_CAPTURE
+                        ),
+                    ): bool,
                 }
             ),
             errors=errors,
@@ -7,9 +7,78 @@ from homeassistant.const import Platform
 DOMAIN = "myair3"
 PLATFORMS = [Platform.CLIMATE, Platform.SENSOR]
 
+# Listener context scope for entities that read system-level data
+SCOPE_SYSTEM = "system"
+
+# Dedicated connection pool per controller
+CONNECTION_LIMIT = 4
+CONNECTION_KEEPALIVE = 20
+DNS_CACHE_TTL = 300
+
+# Last known state is cached so entities can be created before the first poll
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+SNAPSHOT_STORAGE_VERSION = 1
+
 DEFAULT_PASSWORD = "password"
 DEFAULT_SCAN_INTERVAL = 30
 
+# Adaptive polling: fast after a command, normal while on, slow while off
+CONF_FAST_SCAN_INTERVAL = "fast_scan_interval"
+CONF_FAST_POLL_WINDOW = "fast_poll_window"
+CONF_IDLE_SCAN_INTERVAL = "idle_scan_interval"
+DEFAULT_FAST_SCAN_INTERVAL = 5
+DEFAULT_FAST_POLL_WINDOW = 60
+DEFAULT_IDLE_SCAN_INTERVAL = 300
+
+# Seconds to wait for further commands before sending a merged batch
+COMMAND_DEBOUNCE = 0.3
+
+# Apply acknowledged writes to local state instead of refreshing
+CONF_OPTIMISTIC = "optimistic"
+DEFAULT_OPTIMISTIC = True
+
+# Maximum number of getZoneData requests in flight at once (0 = unlimited)
+CONF_ZONE_CONCURRENCY = "zone_concurrency"
+DEFAULT_ZONE_CONCURRENCY = 1
+
+# Seconds a failing zone keeps showing its last good state
+CONF_ZONE_MAX_AGE = "zone_max_age"
+DEFAULT_ZONE_MAX_AGE = 300
+
+# Measurement sensors: readings within the deadband of the published value
+# are held back; 0 publishes every change
+CONF_TEMP_DEADBAND = "temp_deadband"
+DEFAULT_TEMP_DEADBAND = 0.0
+CONF_DAMPER_DEADBAND = "damper_deadband"
+DEFAULT_DAMPER_DEADBAND = 0
+CONF_MIN_PUBLISH_INTERVAL = "min_publish_interval"
+DEFAULT_MIN_PUBLISH_INTERVAL = 0
+CONF_MAX_PUBLISH_INTERVAL = "max_publish_interval"
+DEFAULT_MAX_PUBLISH_INTERVAL = 900
+
+# Append every controller exchange to <config>/myair3_capture_<host>.jsonl
+CONF_CAPTURE = "capture"
+DEFAULT_CAPTURE = False
+
+# Request timeouts adapt to observed latency within these bounds (seconds)
+CONF_TIMEOUT_FLOOR = "timeout_floor"
+DEFAULT_TIMEOUT_FLOOR = 2.0
+CONF_TIMEOUT_CEILING = "timeout_ceiling"
+DEFAULT_TIMEOUT_CEILING = 10.0
+
+# Maximum requests of any kind in flight to the controller (0 = unlimited)
+CONF_REQUEST_LIMIT = "request_limit"
+DEFAULT_REQUEST_LIMIT = 1
+
+# Zones refreshed per poll in rotation (0 = every zone every poll)
+CONF_ZONES_PER_POLL = "zones_per_poll"
+DEFAULT_ZONES_PER_POLL = 0
+
+# Successful polls in a row a zone must be missing from before its entities
+# are deleted from the entity registry
+ZONE_REMOVAL_POLLS = 3
+
 # MyAir3 API Mappings (from HA to API integer codes)
 MODE_TO_MYAIR3 = {
     HVACMode.COOL: 1,
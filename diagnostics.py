@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -9,6 +10,7 @@ from homeassistant.core import HomeAssistant
 
 from . import MyAir3Coordinator
 from .const import DOMAIN
+from .scheduler import PRIORITY_NAMES
 
 
 async def async_get_config_entry_diagnostics(
@@ -16,34 +18,62 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator: MyAir3Coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data
 
     return {
         "entry_data": {
             "host": entry.data.get("host"),
         },
         "coordinator_last_update_success": coordinator.last_update_success,
-        "coordinator_last_update": coordinator.last_update_success,
+        "restored": coordinator.restored,
+        "coordinator_last_update": coordinator.metrics.last_success.isoformat()
+        if coordinator.metrics.last_success
+        else None,
+        "session": {
+            "relogin_count": coordinator.relogin_count,
+            "last_session_duration": coordinator.last_session_duration,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "resilience": {
+            "timeouts": coordinator.timeouts.as_dict(),
+            "retries": coordinator.retry_count,
+            "circuit_breaker": coordinator.breaker.as_dict(),
+        },
+        "scheduler": {
+            "limit": coordinator.scheduler.limit,
+            "queue_depth": coordinator.scheduler.queue_depth,
+            **coordinator.scheduler.metrics.as_dict(PRIORITY_NAMES),
+        },
+        "parse_cache": coordinator.parse_cache.as_dict(),
+        "listener_updates": {
+            "performed": coordinator.listener_updates,
+            "skipped": coordinator.listener_updates_skipped,
+        },
         "system_data": {
-            "power": "on" if coordinator.data["airconOnOff"] == 1 else "off",
-            "mode": {1: "cool", 2: "heat", 3: "fan"}.get(
-                coordinator.data["mode"], "unknown"
-            ),
+            "power": "on" if data.aircon_on_off == 1 else "off",
+            "mode": {1: "cool", 2: "heat", 3: "fan"}.get(data.mode, "unknown"),
             "fan_speed": {1: "low", 2: "medium", 3: "high"}.get(
-                coordinator.data["fanSpeed"], "unknown"
+                data.fan_speed, "unknown"
             ),
-            "current_temp": coordinator.data["centralActualTemp"],
-            "target_temp": coordinator.data["centralDesiredTemp"],
-            "num_zones": len(coordinator.data["zones"]),
+            "current_temp": data.central_actual_temp,
+            "target_temp": data.central_desired_temp,
+            "num_zones": len(data.zones),
         },
         "zones": {
             zone_id: {
-                "name": zone_data["name"],
-                "power": "on" if zone_data["setting"] == 1 else "off",
-                "current_temp": zone_data["actualTemp"],
-                "target_temp": zone_data["desiredTemp"],
-                "damper_position": zone_data["userPercentSetting"],
-                "temp_sensor_available": zone_data["tempSensorAvailable"],
+                "name": zone.name,
+                "power": "on" if zone.setting == 1 else "off",
+                "current_temp": zone.actual_temp,
+                "target_temp": zone.desired_temp,
+                "damper_position": zone.user_percent_setting,
+                "temp_sensor_available": zone.temp_sensor_available,
+                "available": coordinator.zone_available(zone_id),
+                "seconds_since_update": round(
+                    time.monotonic() - coordinator.zone_updated[zone_id], 1
+                )
+                if zone_id in coordinator.zone_updated
+                else None,
             }
-            for zone_id, zone_data in coordinator.data["zones"].items()
+            for zone_id, zone in data.zones.items()
         },
     }
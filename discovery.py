@@ -0,0 +1,126 @@
+"""Find MyAir3 controllers on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from ipaddress import ip_network
+import logging
+from xml.etree.ElementTree import ParseError
+
+import aiohttp
+from defusedxml.ElementTree import fromstring
+
+from .const import DEFAULT_PASSWORD
+from .parser import parse_system
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT = 80
+DEFAULT_SCAN_CONCURRENCY = 32
+# Largest network a scan may cover (a /22)
+MAX_SCAN_HOSTS = 1024
+
+# Hosts that do not answer a connect within a second are not controllers
+SCAN_TIMEOUT = aiohttp.ClientTimeout(total=3, sock_connect=1)
+# Manual entry gets a little longer but still fails fast on a wrong address
+PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5, sock_connect=2)
+
+
+def looks_like_myair3(body: bytes) -> bool:
+    """Return whether a getSystemData response sent before login is MyAir3's.
+
+    Without a session the controller still answers with its XML document,
+    holding an authenticated element instead of the unit data.
+    """
+    try:
+        root = fromstring(body)
+    except (ParseError, ValueError):
+        return False
+    return (
+        next(root.iter("authenticated"), None) is not None
+        or next(root.iter("unitcontrol"), None) is not None
+    )
+
+
+def is_myair3_response(body: bytes) -> bool:
+    """Return whether a getSystemData response came from a MyAir3 controller."""
+    try:
+        parse_system(body)
+    except (ParseError, ValueError):
+        return False
+    return True
+
+
+async def async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    password: str = DEFAULT_PASSWORD,
+    timeout: aiohttp.ClientTimeout = PROBE_TIMEOUT,
+) -> bool:
+    """Return whether host is a MyAir3 controller that accepts password.
+
+    The password is only sent once an unauthenticated getSystemData has
+    answered like a MyAir3 controller, so other HTTP services on the
+    network never see it.
+    """
+    try:
+        async with session.get(
+            f"http://{host}/getSystemData", timeout=timeout
+        ) as resp:
+            if resp.status not in (200, 401, 403) or not looks_like_myair3(
+                await resp.read()
+            ):
+                return False
+        async with session.get(
+            f"http://{host}/login?password={password}", timeout=timeout
+        ) as resp:
+            if resp.status != 200:
+                return False
+        async with session.get(
+            f"http://{host}/getSystemData", timeout=timeout
+        ) as resp:
+            if resp.status != 200:
+                return False
+            return is_myair3_response(await resp.read())
+    except (TimeoutError, aiohttp.ClientError, OSError) as err:
+        _LOGGER.debug("Probing %s failed: %s", host, err)
+        return False
+
+
+def scan_hosts(network: str, port: int = DEFAULT_PORT) -> list[str]:
+    """Return the host strings to probe for network.
+
+    Raises ValueError if network is not a valid network or is larger than
+    MAX_SCAN_HOSTS addresses.
+    """
+    parsed = ip_network(network, strict=False)
+    if parsed.num_addresses > MAX_SCAN_HOSTS:
+        raise ValueError(f"{network} has more than {MAX_SCAN_HOSTS} addresses")
+    suffix = "" if port == DEFAULT_PORT else f":{port}"
+    return [f"{address}{suffix}" for address in parsed.hosts()]
+
+
+async def async_discover(
+    session: aiohttp.ClientSession,
+    network: str,
+    port: int = DEFAULT_PORT,
+    password: str = DEFAULT_PASSWORD,
+    concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    exclude: Iterable[str] = (),
+) -> list[str]:
+    """Probe every host of network and return the MyAir3 controllers found.
+
+    At most concurrency hosts are probed at once, each with SCAN_TIMEOUT.
+    Hosts in exclude, such as already configured ones, are skipped.
+    """
+    skip = set(exclude)
+    hosts = [host for host in scan_hosts(network, port) if host not in skip]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> bool:
+        async with semaphore:
+            return await async_probe(session, host, password, SCAN_TIMEOUT)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    return [host for host, found in zip(hosts, results) if found]
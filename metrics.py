@@ -0,0 +1,179 @@
+"""Request and poll metrics for MyAir3 controllers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+# Upper bounds (seconds) of the latency histogram buckets; a final bucket
+# counts everything slower
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+ENDPOINTS = ("login", "getSystemData", "getZoneData", "setSystemData", "setZoneData")
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Counters and latency histogram for one controller endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    def record(self, latency: float, size: int, error: bool) -> None:
+        """Record one request."""
+        self.requests += 1
+        self.errors += error
+        self.bytes += size
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                break
+        else:
+            index = len(LATENCY_BUCKETS)
+        self.histogram[index] += 1
+
+    @property
+    def latency_mean(self) -> float | None:
+        """Return the mean latency in seconds."""
+        if not self.requests:
+            return None
+        return self.latency_total / self.requests
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency_mean": self.latency_mean,
+            "latency_max": self.latency_max,
+            "latency_histogram": {
+                **{
+                    f"<={bound}s": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.histogram)
+                },
+                f">{LATENCY_BUCKETS[-1]}s": self.histogram[-1],
+            },
+        }
+
+
+@dataclass(slots=True)
+class ConnectionMetrics:
+    """How often requests reuse a kept-alive connection."""
+
+    created: int = 0
+    reused: int = 0
+
+    @property
+    def reuse_rate(self) -> float | None:
+        """Return the fraction of requests that reused a connection."""
+        total = self.created + self.reused
+        if not total:
+            return None
+        return self.reused / total
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "reuse_rate": self.reuse_rate,
+        }
+
+
+@dataclass(slots=True)
+class SchedulerMetrics:
+    """Queue depth and wait times of the request scheduler."""
+
+    queue_depth_max: int = 0
+    waits: dict[int, int] = field(default_factory=dict)
+    wait_total: dict[int, float] = field(default_factory=dict)
+    wait_max: dict[int, float] = field(default_factory=dict)
+    preempted: int = 0
+
+    def record_depth(self, depth: int) -> None:
+        """Record the queue depth after a request was queued."""
+        self.queue_depth_max = max(self.queue_depth_max, depth)
+
+    def record_wait(self, priority: int, wait: float) -> None:
+        """Record how long a request waited for a slot."""
+        self.waits[priority] = self.waits.get(priority, 0) + 1
+        self.wait_total[priority] = self.wait_total.get(priority, 0.0) + wait
+        self.wait_max[priority] = max(self.wait_max.get(priority, 0.0), wait)
+
+    def wait_mean(self, priority: int) -> float | None:
+        """Return the mean wait in seconds for a priority."""
+        if not self.waits.get(priority):
+            return None
+        return self.wait_total[priority] / self.waits[priority]
+
+    def as_dict(self, names: dict[int, str]) -> dict[str, Any]:
+        """Return the metrics for diagnostics, priorities keyed by name."""
+        return {
+            "queue_depth_max": self.queue_depth_max,
+            "preempted": self.preempted,
+            "waits": {
+                name: {
+                    "count": self.waits.get(priority, 0),
+                    "wait_mean": self.wait_mean(priority),
+                    "wait_max": self.wait_max.get(priority, 0.0),
+                }
+                for priority, name in names.items()
+            },
+        }
+
+
+@dataclass(slots=True)
+class CoordinatorMetrics:
+    """Metrics for all requests and polls of one coordinator."""
+
+    endpoints: dict[str, EndpointMetrics] = field(
+        default_factory=lambda: {endpoint: EndpointMetrics() for endpoint in ENDPOINTS}
+    )
+    polls: int = 0
+    poll_failures: int = 0
+    poll_duration: float | None = None
+    poll_duration_max: float = 0.0
+    last_success: datetime | None = None
+    connections: ConnectionMetrics = field(default_factory=ConnectionMetrics)
+
+    def endpoint(self, name: str) -> EndpointMetrics:
+        """Return the metrics for an endpoint, creating unknown ones."""
+        metrics = self.endpoints.get(name)
+        if metrics is None:
+            metrics = self.endpoints[name] = EndpointMetrics()
+        return metrics
+
+    def record_poll(self, duration: float, success: bool, now: datetime) -> None:
+        """Record a full poll."""
+        self.polls += 1
+        if not success:
+            self.poll_failures += 1
+            return
+        self.poll_duration = duration
+        self.poll_duration_max = max(self.poll_duration_max, duration)
+        self.last_success = now
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "polls": self.polls,
+            "poll_failures": self.poll_failures,
+            "poll_duration": self.poll_duration,
+            "poll_duration_max": self.poll_duration_max,
+            "last_success": self.last_success.isoformat()
+            if self.last_success
+            else None,
+            "endpoints": {
+                name: metrics.as_dict() for name, metrics in self.endpoints.items()
+            },
+            "connections": self.connections.as_dict(),
+        }
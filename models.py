@@ -0,0 +1,193 @@
+"""State model for MyAir3 coordinator data."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from .const import SCOPE_SYSTEM
+
+# Controller field names -> SystemState attributes
+SYSTEM_FIELDS = {
+    "airconOnOff": "aircon_on_off",
+    "mode": "mode",
+    "fanSpeed": "fan_speed",
+    "centralDesiredTemp": "central_desired_temp",
+    "centralActualTemp": "central_actual_temp",
+}
+
+# Controller field names -> ZoneState attributes
+ZONE_FIELDS = {
+    "name": "name",
+    "setting": "setting",
+    "desiredTemp": "desired_temp",
+    "actualTemp": "actual_temp",
+    "userPercentSetting": "user_percent_setting",
+    "hasLowBatt": "has_low_batt",
+}
+
+# setSystemData/setZoneData parameters -> attributes they change
+WRITE_PARAMS = {
+    **SYSTEM_FIELDS,
+    "zoneSetting": "setting",
+    "desiredTemp": "desired_temp",
+    "userPercentSetting": "user_percent_setting",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneState:
+    """State of one zone as reported by getZoneData."""
+
+    name: str
+    setting: int = 0
+    desired_temp: float = 20.0
+    actual_temp: float = 20.0
+    user_percent_setting: int = 0
+    has_low_batt: bool = False
+
+    @property
+    def temp_sensor_available(self) -> bool:
+        """Return whether the zone's temperature sensor can be trusted."""
+        return not self.has_low_batt
+
+
+@dataclass(frozen=True, slots=True)
+class SystemState:
+    """State of the unit as reported by getSystemData, plus its zones."""
+
+    aircon_on_off: int = 0
+    mode: int = 1
+    fan_speed: int = 1
+    central_desired_temp: float = 20.0
+    central_actual_temp: float = 20.0
+    zones: dict[int, ZoneState] = field(default_factory=dict)
+
+
+# setSystemData/setZoneData parameters captured by a snapshot
+SNAPSHOT_SYSTEM_PARAMS = ("airconOnOff", "mode", "fanSpeed", "centralDesiredTemp")
+SNAPSHOT_ZONE_PARAMS = ("zoneSetting", "desiredTemp")
+
+SYSTEM_ATTRS = tuple(SYSTEM_FIELDS.values())
+ZONE_ATTRS = tuple(ZONE_FIELDS.values())
+
+# Listener key attribute for a zone going (un)available
+ZONE_AVAILABLE = "available"
+# System-scope listener key attribute for zones appearing, disappearing or
+# being renamed
+ZONE_TOPOLOGY = "zones"
+
+
+def system_keys(*attrs: str) -> frozenset[tuple[str, str]]:
+    """Return listener keys for system attributes (all of them if none given)."""
+    return frozenset((SCOPE_SYSTEM, attr) for attr in attrs or SYSTEM_ATTRS)
+
+
+def zone_keys(zone_id: int, *attrs: str) -> frozenset[tuple[int, str]]:
+    """Return listener keys for zone attributes (all of them if none given).
+
+    The zone's availability key is always included.
+    """
+    return frozenset(
+        (zone_id, attr) for attr in (*(attrs or ZONE_ATTRS), ZONE_AVAILABLE)
+    )
+
+
+def changed_keys(old: SystemState, new: SystemState) -> set[tuple[int | str, str]]:
+    """Return the (scope, attribute) keys whose value differs between states.
+
+    Zones that appeared or disappeared count as changed in every attribute,
+    and they or a zone rename also change the system ZONE_TOPOLOGY key.
+    Zone states that are the same object are skipped without comparing.
+    """
+    changed: set[tuple[int | str, str]] = {
+        (SCOPE_SYSTEM, attr)
+        for attr in SYSTEM_ATTRS
+        if getattr(old, attr) != getattr(new, attr)
+    }
+    old_zones, new_zones = old.zones, new.zones
+    if old_zones is new_zones:
+        return changed
+    for zone_id in old_zones.keys() | new_zones.keys():
+        old_zone = old_zones.get(zone_id)
+        new_zone = new_zones.get(zone_id)
+        if old_zone is new_zone:
+            continue
+        if old_zone is None or new_zone is None:
+            changed.update(zone_keys(zone_id))
+            changed.add((SCOPE_SYSTEM, ZONE_TOPOLOGY))
+            continue
+        changed.update(
+            (zone_id, attr)
+            for attr in ZONE_ATTRS
+            if getattr(old_zone, attr) != getattr(new_zone, attr)
+        )
+        if old_zone.name != new_zone.name:
+            changed.add((SCOPE_SYSTEM, ZONE_TOPOLOGY))
+    return changed
+
+
+def state_as_dict(state: SystemState) -> dict[str, Any]:
+    """Return a JSON-serialisable copy of state."""
+    return asdict(state)
+
+
+def state_from_dict(data: dict[str, Any]) -> SystemState:
+    """Rebuild state saved with state_as_dict.
+
+    Raises TypeError, KeyError or ValueError if data does not match the
+    current model.
+    """
+    zones = data["zones"]
+    return SystemState(
+        **{attr: data[attr] for attr in SYSTEM_ATTRS},
+        zones={
+            int(zone_id): ZoneState(**{attr: zone[attr] for attr in ZONE_ATTRS})
+            for zone_id, zone in zones.items()
+        },
+    )
+
+
+def snapshot_params(state: SystemState) -> dict[str, Any]:
+    """Return the write parameters that would recreate state's settings."""
+    return {
+        "system": {
+            param: getattr(state, WRITE_PARAMS[param])
+            for param in SNAPSHOT_SYSTEM_PARAMS
+        },
+        "zones": {
+            str(zone_id): {
+                param: getattr(zone, WRITE_PARAMS[param])
+                for param in SNAPSHOT_ZONE_PARAMS
+            }
+            for zone_id, zone in state.zones.items()
+        },
+    }
+
+
+def snapshot_writes(
+    snapshot: dict[str, Any], state: SystemState
+) -> dict[int | None, dict[str, Any]]:
+    """Return the writes needed to bring state back to snapshot.
+
+    Writes are keyed by zone id, None for the system. Only parameters that
+    differ are included, and zones that no longer exist are skipped.
+    """
+    current = snapshot_params(state)
+    writes: dict[int | None, dict[str, Any]] = {}
+    if system := {
+        param: value
+        for param, value in snapshot["system"].items()
+        if current["system"].get(param) != value
+    }:
+        writes[None] = system
+    for zone_id, params in snapshot["zones"].items():
+        if (zone_current := current["zones"].get(zone_id)) is None:
+            continue
+        if zone := {
+            param: value
+            for param, value in params.items()
+            if zone_current.get(param) != value
+        }:
+            writes[int(zone_id)] = zone
+    return writes
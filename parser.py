@@ -0,0 +1,121 @@
+"""Parsers for MyAir3 controller XML responses."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from defusedxml.ElementTree import fromstring
+
+from .models import SYSTEM_FIELDS, ZONE_FIELDS, SystemState, ZoneState
+
+_Converters = dict[str, tuple[str, Callable[[str], Any]]]
+_T = TypeVar("_T")
+
+_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    "name": str,
+    "centralDesiredTemp": float,
+    "centralActualTemp": float,
+    "desiredTemp": float,
+    "actualTemp": float,
+    "hasLowBatt": lambda text: int(text) == 1,
+}
+
+# unitcontrol tag -> (SystemState attribute, converter)
+_SYSTEM: _Converters = {
+    tag: (attr, _CONVERTERS.get(tag, int)) for tag, attr in SYSTEM_FIELDS.items()
+}
+_SYSTEM["numberOfZones"] = ("number_of_zones", int)
+
+# zoneN tag -> (ZoneState attribute, converter)
+_ZONE: _Converters = {
+    tag: (attr, _CONVERTERS.get(tag, int)) for tag, attr in ZONE_FIELDS.items()
+}
+
+
+def _extract(element, fields: _Converters) -> dict[str, Any]:
+    """Convert the known child fields of element in a single pass.
+
+    Missing or empty fields are left out so the model defaults apply.
+    """
+    values: dict[str, Any] = {}
+    for child in element:
+        spec = fields.get(child.tag)
+        if spec is not None and child.text:
+            values[spec[0]] = spec[1](child.text)
+    return values
+
+
+def parse_system(body: bytes) -> tuple[SystemState, int]:
+    """Parse a getSystemData response into system state and zone count.
+
+    The returned state has no zones. Raises ValueError if the response has
+    no unitcontrol block.
+    """
+    unitcontrol = next(fromstring(body).iter("unitcontrol"), None)
+    if unitcontrol is None:
+        raise ValueError("No unitcontrol data in response")
+    values = _extract(unitcontrol, _SYSTEM)
+    num_zones = values.pop("number_of_zones", 0)
+    return SystemState(**values), num_zones
+
+
+def parse_zone(body: bytes, zone_id: int) -> ZoneState | None:
+    """Parse a getZoneData response, or return None if the zone is missing."""
+    zone_elem = next(fromstring(body).iter(f"zone{zone_id}"), None)
+    if zone_elem is None:
+        return None
+    values = _extract(zone_elem, _ZONE)
+    values.setdefault("name", f"Zone {zone_id}")
+    return ZoneState(**values)
+
+
+def is_acknowledged(body: bytes) -> bool:
+    """Return whether a set* response acknowledges the write."""
+    return b"<ack>1</ack>" in body
+
+
+class ParseCache:
+    """Reuse parsed results for byte-identical responses.
+
+    Each key keeps its last response body with the parsed result. A
+    response with the same bytes returns that same object without parsing,
+    so unchanged zones keep their identity and change detection can skip
+    them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._entries: dict[Hashable, tuple[bytes, Any]] = {}
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+
+    def parse(
+        self,
+        endpoint: str,
+        key: Hashable,
+        body: bytes,
+        parser: Callable[[bytes], _T],
+    ) -> _T:
+        """Return parser(body), reusing the result for an unchanged body."""
+        entry = self._entries.get((endpoint, key))
+        if entry is not None and entry[0] == body:
+            self.hits[endpoint] += 1
+            return entry[1]
+        result = parser(body)
+        self._entries[(endpoint, key)] = (body, result)
+        self.misses[endpoint] += 1
+        return result
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return hit counters per endpoint for diagnostics."""
+        return {
+            endpoint: {
+                "hits": self.hits[endpoint],
+                "misses": self.misses[endpoint],
+                "hit_rate": self.hits[endpoint]
+                / (self.hits[endpoint] + self.misses[endpoint]),
+            }
+            for endpoint in self.hits.keys() | self.misses.keys()
+        }
@@ -0,0 +1,136 @@
+"""Timeouts, retries and circuit breaking for MyAir3 controller requests."""
+
+from __future__ import annotations
+
+from collections import deque
+import random
+import time
+from typing import Any
+
+# Latency samples kept per endpoint and the percentile timeouts follow
+LATENCY_WINDOW = 50
+LATENCY_PERCENTILE = 0.95
+# Samples needed before the ceiling is replaced by an adaptive timeout
+MIN_LATENCY_SAMPLES = 5
+# Timeout as a multiple of the percentile latency
+TIMEOUT_MULTIPLIER = 4.0
+
+# get* requests are retried this many times after the first attempt
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF = 0.25
+RETRY_BACKOFF_MAX = 2.0
+
+# Requests failing in a row before the breaker opens, and how long it stays
+# open before letting one probe through (doubling while probes fail)
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+BREAKER_COOLDOWN_MAX = 300.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a jittered delay before retry number attempt (0-based)."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2**attempt))
+
+
+class AdaptiveTimeouts:
+    """Per-endpoint timeouts that follow observed latency.
+
+    The timeout is TIMEOUT_MULTIPLIER times the LATENCY_PERCENTILE latency
+    of recent successful requests, kept between floor and ceiling. Until
+    an endpoint has MIN_LATENCY_SAMPLES samples the ceiling applies.
+    """
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize."""
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of a successful request."""
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=LATENCY_WINDOW)
+        samples.append(latency)
+
+    def timeout(self, endpoint: str) -> float:
+        """Return the timeout in seconds for the next request to endpoint."""
+        samples = self._samples.get(endpoint)
+        if samples is None or len(samples) < MIN_LATENCY_SAMPLES:
+            return self.ceiling
+        ordered = sorted(samples)
+        percentile = ordered[
+            min(len(ordered) - 1, int(len(ordered) * LATENCY_PERCENTILE))
+        ]
+        return min(self.ceiling, max(self.floor, percentile * TIMEOUT_MULTIPLIER))
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the current timeout per endpoint for diagnostics."""
+        return {endpoint: self.timeout(endpoint) for endpoint in self._samples}
+
+
+class CircuitBreaker:
+    """Stop sending requests to a controller that keeps failing.
+
+    After BREAKER_THRESHOLD failed requests in a row the breaker opens and
+    requests fail straight away. Once the cooldown has passed one request
+    is let through as a probe: success closes the breaker, failure reopens
+    it with twice the cooldown, up to BREAKER_COOLDOWN_MAX.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.failures = 0
+        self.cooldown = BREAKER_COOLDOWN
+        self.opened_at: float | None = None
+        self.trips = 0
+        self._probe_started: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are being held back."""
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now.
+
+        While open, returns True once per cooldown for the probe request. A
+        probe that never reports back is replaced after another cooldown.
+        """
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < self.cooldown or (
+            self._probe_started is not None
+            and now - self._probe_started < self.cooldown
+        ):
+            return False
+        self._probe_started = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a request succeeded."""
+        self.failures = 0
+        self.cooldown = BREAKER_COOLDOWN
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker at the threshold."""
+        self.failures += 1
+        if self._probe_started is not None:
+            self._probe_started = None
+            self.cooldown = min(self.cooldown * 2, BREAKER_COOLDOWN_MAX)
+            self.opened_at = time.monotonic()
+        elif self.opened_at is None and self.failures >= BREAKER_THRESHOLD:
+            self.opened_at = time.monotonic()
+            self.trips += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "open": self.is_open,
+            "consecutive_failures": self.failures,
+            "cooldown": self.cooldown,
+            "trips": self.trips,
+        }
@@ -0,0 +1,132 @@
+"""Per-controller request scheduling for MyAir3."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import heapq
+import itertools
+import time
+from typing import TypeVar
+
+from .metrics import SchedulerMetrics
+
+_T = TypeVar("_T")
+
+# Lower runs first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_NAMES = {PRIORITY_COMMAND: "command", PRIORITY_POLL: "poll"}
+
+
+@dataclass(eq=False, slots=True)
+class _Job:
+    """One request waiting for or holding a slot."""
+
+    priority: int
+    seq: int
+    waiter: asyncio.Future[None] | None = None
+    task: asyncio.Future | None = None
+    preempted: bool = False
+
+
+class RequestScheduler:
+    """Run requests to one controller with a limit on how many run at once.
+
+    Queued commands are started before queued polls. A command that finds
+    every slot taken by poll requests aborts one of them; the aborted poll
+    request goes back in the queue and is retried, so callers only see a
+    delay. Commands are never aborted.
+    """
+
+    def __init__(self, limit: int = 1) -> None:
+        """Initialize with a request limit (0 = unlimited)."""
+        self.limit = limit
+        self.metrics = SchedulerMetrics()
+        self._running: list[_Job] = []
+        self._queue: list[tuple[int, int, _Job]] = []
+        self._seq = itertools.count()
+
+    async def run(self, priority: int, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Wait for a slot, then await func() and return its result."""
+        job = _Job(priority, next(self._seq))
+        while True:
+            queued = time.monotonic()
+            await self._acquire(job)
+            self.metrics.record_wait(priority, time.monotonic() - queued)
+            job.task = asyncio.ensure_future(func())
+            try:
+                return await job.task
+            except asyncio.CancelledError:
+                if not job.preempted or asyncio.current_task().cancelling():
+                    raise
+            finally:
+                self._running.remove(job)
+                job.task = None
+                self._release_next()
+            job.preempted = False
+            self.metrics.preempted += 1
+
+    def set_limit(self, limit: int) -> None:
+        """Change the request limit, starting queued requests it allows."""
+        self.limit = limit
+        self._release_next()
+
+    def _has_free_slot(self) -> bool:
+        """Return whether another request may start now."""
+        return not self.limit or len(self._running) < self.limit
+
+    async def _acquire(self, job: _Job) -> None:
+        """Take a slot, queueing by priority until one is free."""
+        if self._has_free_slot() and not self._queue:
+            self._running.append(job)
+            return
+        entry = (job.priority, job.seq, job)
+        heapq.heappush(self._queue, entry)
+        self.metrics.record_depth(len(self._queue))
+        job.waiter = asyncio.get_running_loop().create_future()
+        if job.priority == PRIORITY_COMMAND:
+            self._preempt()
+        try:
+            await job.waiter
+        except asyncio.CancelledError:
+            if job in self._running:
+                # Granted the slot just as the caller gave up
+                self._running.remove(job)
+                self._release_next()
+            elif entry in self._queue:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+            raise
+        finally:
+            job.waiter = None
+
+    def _preempt(self) -> None:
+        """Abort a running poll request to free a slot for a command."""
+        if self._has_free_slot():
+            return
+        for running in self._running:
+            if (
+                running.priority != PRIORITY_COMMAND
+                and running.task is not None
+                and not running.preempted
+                and running.task.cancel()
+            ):
+                running.preempted = True
+                return
+
+    def _release_next(self) -> None:
+        """Hand free slots to the highest priority queued requests."""
+        while self._queue and self._has_free_slot():
+            _, _, job = heapq.heappop(self._queue)
+            if job.waiter is None or job.waiter.done():
+                # The caller was cancelled and has not cleaned up yet
+                continue
+            self._running.append(job)
+            job.waiter.set_result(None)
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return len(self._queue)
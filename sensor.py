@@ -1,6 +1,11 @@
 """Sensor platform for MyAir3."""
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
 import logging
+import time
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -8,17 +13,51 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from . import MyAir3Coordinator
-from .const import DOMAIN
+from .const import (
+    CONF_DAMPER_DEADBAND,
+    CONF_MAX_PUBLISH_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_TEMP_DEADBAND,
+    DEFAULT_DAMPER_DEADBAND,
+    DEFAULT_MAX_PUBLISH_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
+    DEFAULT_TEMP_DEADBAND,
+    DOMAIN,
+)
+from .metrics import ENDPOINTS
+from .models import SYSTEM_FIELDS, ZONE_FIELDS, system_keys, zone_keys
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class PublishFilter:
+    """When a measurement sensor publishes a new reading.
+
+    Readings within deadband of the published value are held back, and
+    readings arriving less than min_interval seconds after the last publish
+    are delayed. The current reading is always published max_interval
+    seconds after the last publish (0 = never forced).
+    """
+
+    deadband: float = 0.0
+    min_interval: float = 0.0
+    max_interval: float = 0.0
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -26,12 +65,18 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor platform from config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    temp_filter, damper_filter = _publish_filters(config_entry.options)
+    platform = entity_platform.async_get_current_platform()
 
     entities: list[SensorEntity] = []
 
     entities.append(
         MyAir3SystemTempSensor(
-            coordinator, config_entry.entry_id, "Actual", "centralActualTemp"
+            coordinator,
+            config_entry.entry_id,
+            "Actual",
+            "centralActualTemp",
+            temp_filter,
         )
     )
     entities.append(
@@ -40,24 +85,191 @@ async def async_setup_entry(
         )
     )
 
-    zones = coordinator.data.get("zones", {})
-    for zone_id in zones:
-        entities.append(MyAir3DamperSensor(coordinator, zone_id, config_entry.entry_id))
+    entities.append(
+        MyAir3MetricSensor(coordinator, config_entry.entry_id, "poll_duration")
+    )
+    entities.append(
+        MyAir3MetricSensor(coordinator, config_entry.entry_id, "connection_reuse")
+    )
+    for endpoint in ENDPOINTS:
         entities.append(
-            MyAir3ZoneTempSensor(
-                coordinator, zone_id, config_entry.entry_id, "Actual", "actualTemp"
+            MyAir3MetricSensor(
+                coordinator, config_entry.entry_id, "endpoint_latency", endpoint
             )
         )
         entities.append(
-            MyAir3ZoneTempSensor(
-                coordinator, zone_id, config_entry.entry_id, "Target", "desiredTemp"
+            MyAir3MetricSensor(
+                coordinator, config_entry.entry_id, "endpoint_errors", endpoint
             )
         )
 
     async_add_entities(entities)
 
+    def create_zone_sensors(zone_id: int) -> list[SensorEntity]:
+        """Return the sensors of one zone."""
+        return [
+            MyAir3DamperSensor(
+                coordinator, zone_id, config_entry.entry_id, damper_filter
+            ),
+            MyAir3ZoneTempSensor(
+                coordinator,
+                zone_id,
+                config_entry.entry_id,
+                "Actual",
+                "actualTemp",
+                temp_filter,
+            ),
+            MyAir3ZoneTempSensor(
+                coordinator, zone_id, config_entry.entry_id, "Target", "desiredTemp"
+            ),
+        ]
+
+    # Zone sensors follow the zones the controller reports
+    config_entry.async_on_unload(
+        coordinator.async_add_zone_entities(create_zone_sensors, async_add_entities)
+    )
+
+    async def async_update_filters(hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Apply changed filter options to the current sensors."""
+        nonlocal temp_filter, damper_filter
+        temp_filter, damper_filter = _publish_filters(entry.options)
+        for entity in list(platform.entities.values()):
+            if isinstance(entity, MyAir3DamperSensor):
+                entity.async_set_publish_filter(damper_filter)
+            elif (
+                isinstance(entity, MyAir3TempSensorBase)
+                and entity.publish_filter is not None
+            ):
+                entity.async_set_publish_filter(temp_filter)
+
+    config_entry.async_on_unload(config_entry.add_update_listener(async_update_filters))
+
+
+def _publish_filters(options: Mapping[str, Any]) -> tuple[PublishFilter, PublishFilter]:
+    """Return the temperature and damper sensor filters set in options."""
+    min_interval = options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL)
+    max_interval = options.get(CONF_MAX_PUBLISH_INTERVAL, DEFAULT_MAX_PUBLISH_INTERVAL)
+    return (
+        PublishFilter(
+            options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+            min_interval,
+            max_interval,
+        ),
+        PublishFilter(
+            options.get(CONF_DAMPER_DEADBAND, DEFAULT_DAMPER_DEADBAND),
+            min_interval,
+            max_interval,
+        ),
+    )
+
 
-class MyAir3TempSensorBase(SensorEntity):
+class MyAir3FilteredSensor(SensorEntity):
+    """Measurement sensor that publishes readings through a PublishFilter.
+
+    Subclasses set _field to the SystemState attribute to read, or the
+    ZoneState attribute when _zone_id is set, and set _listener_keys.
+    Without a filter every coordinator update is published.
+    """
+
+    coordinator: MyAir3Coordinator
+    _field: str
+    _zone_id: int | None = None
+    _listener_keys: frozenset
+    _publish_filter: PublishFilter | None = None
+    _published: float | None = None
+    _published_at: float | None = None
+    _published_flags: tuple[bool, bool] | None = None
+    _cancel_publish: CALLBACK_TYPE | None = None
+
+    def _reading(self) -> float | None:
+        """Return the live reading, or None while the zone is missing."""
+        if self._zone_id is None:
+            return getattr(self.coordinator.data, self._field)
+        zone = self.coordinator.data.zones.get(self._zone_id)
+        return getattr(zone, self._field) if zone else None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last published reading."""
+        return self._published
+
+    async def async_added_to_hass(self):
+        """Connect to coordinator."""
+        self._async_store_published()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(
+                self._async_coordinator_updated, self._listener_keys
+            )
+        )
+        self.async_on_remove(self._async_cancel_publish)
+
+    @property
+    def publish_filter(self) -> PublishFilter | None:
+        """Return the filter readings are published through."""
+        return self._publish_filter
+
+    @callback
+    def async_set_publish_filter(self, publish_filter: PublishFilter) -> None:
+        """Switch to a new filter and publish the live reading under it."""
+        self._publish_filter = publish_filter
+        if self._published_at is not None:
+            self._async_publish()
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        """Publish the new reading unless the filter holds it back."""
+        publish_filter = self._publish_filter
+        if (
+            publish_filter is None
+            or self._published_flags != (self.available, self.assumed_state)
+        ):
+            self._async_publish()
+            return
+        reading = self._reading()
+        if (
+            reading is not None
+            and self._published is not None
+            and abs(reading - self._published) < publish_filter.deadband
+        ):
+            return
+        delay = self._published_at + publish_filter.min_interval - time.monotonic()
+        if delay > 0:
+            self._async_schedule_publish(delay)
+            return
+        self._async_publish()
+
+    @callback
+    def _async_publish(self, _now: datetime | None = None) -> None:
+        """Publish the live reading."""
+        self._async_store_published()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_store_published(self) -> None:
+        """Take the live reading as the published one."""
+        self._published = self._reading()
+        self._published_at = time.monotonic()
+        self._published_flags = (self.available, self.assumed_state)
+        if self._publish_filter is not None and self._publish_filter.max_interval:
+            self._async_schedule_publish(self._publish_filter.max_interval)
+        else:
+            self._async_cancel_publish()
+
+    @callback
+    def _async_schedule_publish(self, delay: float) -> None:
+        """Publish the live reading after delay seconds."""
+        self._async_cancel_publish()
+        self._cancel_publish = async_call_later(self.hass, delay, self._async_publish)
+
+    @callback
+    def _async_cancel_publish(self) -> None:
+        """Cancel a scheduled publish."""
+        if self._cancel_publish is not None:
+            self._cancel_publish()
+            self._cancel_publish = None
+
+
+class MyAir3TempSensorBase(MyAir3FilteredSensor):
     """Base class for MyAir3 temperature sensors."""
 
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
@@ -70,12 +282,14 @@ class MyAir3TempSensorBase(SensorEntity):
         entry_id: str,
         name_suffix: str,
         data_key: str,
+        publish_filter: PublishFilter | None = None,
     ) -> None:
         """Initialize."""
         self.coordinator = coordinator
         self._entry_id = entry_id
         self._data_key = data_key
         self._name_suffix = name_suffix
+        self._publish_filter = publish_filter
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.host)},
             name="MyAir3 System",
@@ -88,17 +302,16 @@ class MyAir3TempSensorBase(SensorEntity):
         """No polling needed."""
         return False
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing cached state from before a restart."""
+        return self.coordinator.restored
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
-    async def async_added_to_hass(self):
-        """Connect to coordinator."""
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
 
 class MyAir3SystemTempSensor(MyAir3TempSensorBase):
     """System temperature sensor."""
@@ -109,17 +322,15 @@ class MyAir3SystemTempSensor(MyAir3TempSensorBase):
         entry_id: str,
         name_suffix: str,
         data_key: str,
+        publish_filter: PublishFilter | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator, entry_id, name_suffix, data_key)
+        super().__init__(coordinator, entry_id, name_suffix, data_key, publish_filter)
+        self._field = SYSTEM_FIELDS[data_key]
+        self._listener_keys = system_keys(self._field)
         self.translation_key = f"system_{name_suffix.lower()}_temp"
         self._attr_unique_id = f"{coordinator.host}_system_{data_key}"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the system temperature."""
-        return self.coordinator.data.get(self._data_key)
-
 
 class MyAir3ZoneTempSensor(MyAir3TempSensorBase):
     """Zone temperature sensor."""
@@ -131,15 +342,18 @@ class MyAir3ZoneTempSensor(MyAir3TempSensorBase):
         entry_id: str,
         name_suffix: str,
         data_key: str,
+        publish_filter: PublishFilter | None = None,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator, entry_id, name_suffix, data_key)
+        super().__init__(coordinator, entry_id, name_suffix, data_key, publish_filter)
         self._zone_id = zone_id
+        self._field = ZONE_FIELDS[data_key]
+        # Availability of the actual temperature follows the battery state
+        self._listener_keys = zone_keys(zone_id, self._field, "has_low_batt")
         self.translation_key = f"zone_{name_suffix.lower()}_temp"
-        zones = coordinator.data.get("zones", {})
-        zone_name = zones.get(zone_id, {}).get("name", f"Zone {zone_id}")
+        zone = coordinator.data.zones.get(zone_id)
         self._attr_translation_placeholders = {
-            "zone_name": zone_name
+            "zone_name": zone.name if zone else f"Zone {zone_id}"
         }
         self._attr_unique_id = f"{coordinator.host}_zone_{zone_id}_{data_key}"
 
@@ -149,30 +363,24 @@ class MyAir3ZoneTempSensor(MyAir3TempSensorBase):
         if not super().available:
             return False
 
-        zone = self.coordinator.data["zones"].get(self._zone_id)
-        if not zone:
+        if not self.coordinator.zone_available(self._zone_id):
             return False
+        zone = self.coordinator.data.zones[self._zone_id]
 
         # Actual temperature sensor is only available if the hardware sensor is working
-        if self._data_key == "actualTemp" and not zone.get("tempSensorAvailable", True):
+        if self._data_key == "actualTemp" and not zone.temp_sensor_available:
             return False
 
         return True
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the zone temperature."""
-        zone = self.coordinator.data["zones"].get(self._zone_id)
-        if not zone:
-            return None
-
-        # If it's the actual temp sensor and it's unavailable, we already return False for available.
-        # However, for consistency with climate.py, we could return the fallback value here if we wanted.
-        # But for a sensor named "Actual Temperature", it's better to stay unavailable.
-        return zone.get(self._data_key)
+    @callback
+    def async_set_zone_name(self, name: str) -> None:
+        """Follow a zone renamed on the controller."""
+        self._attr_translation_placeholders = {"zone_name": name}
+        self.async_write_ha_state()
 
 
-class MyAir3DamperSensor(SensorEntity):
+class MyAir3DamperSensor(MyAir3FilteredSensor):
     """Zone damper position sensor."""
 
     _attr_native_unit_of_measurement = PERCENTAGE
@@ -181,16 +389,22 @@ class MyAir3DamperSensor(SensorEntity):
     translation_key = "damper"
 
     def __init__(
-        self, coordinator: MyAir3Coordinator, zone_id: int, entry_id: str
+        self,
+        coordinator: MyAir3Coordinator,
+        zone_id: int,
+        entry_id: str,
+        publish_filter: PublishFilter | None = None,
     ) -> None:
         """Initialize."""
         self.coordinator = coordinator
         self._zone_id = zone_id
         self._entry_id = entry_id
-        zones = coordinator.data.get("zones", {})
-        zone_name = zones.get(zone_id, {}).get("name", f"Zone {zone_id}")
+        self._publish_filter = publish_filter
+        self._field = "user_percent_setting"
+        self._listener_keys = zone_keys(zone_id, self._field)
+        zone = coordinator.data.zones.get(zone_id)
         self._attr_translation_placeholders = {
-            "zone_name": zone_name
+            "zone_name": zone.name if zone else f"Zone {zone_id}"
         }
         self._attr_unique_id = f"{coordinator.host}_zone_{zone_id}_damper"
         self._attr_device_info = DeviceInfo(
@@ -205,21 +419,96 @@ class MyAir3DamperSensor(SensorEntity):
         """No polling needed, coordinator handles updates."""
         return False
 
+    @property
+    def assumed_state(self) -> bool:
+        """Return True while showing cached state from before a restart."""
+        return self.coordinator.restored
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         if not self.coordinator.last_update_success:
             return False
-        zone = self.coordinator.data["zones"].get(self._zone_id)
-        return zone is not None
+        return self.coordinator.zone_available(self._zone_id)
+
+    @callback
+    def async_set_zone_name(self, name: str) -> None:
+        """Follow a zone renamed on the controller."""
+        self._attr_translation_placeholders = {"zone_name": name}
+        self.async_write_ha_state()
+
+
+class MyAir3MetricSensor(SensorEntity):
+    """Controller request metric, for finding slow or failing controllers."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: MyAir3Coordinator,
+        entry_id: str,
+        metric: str,
+        endpoint: str | None = None,
+    ) -> None:
+        """Initialize.
+
+        metric is poll_duration, connection_reuse, or
+        endpoint_latency/endpoint_errors for the given endpoint.
+        """
+        self.coordinator = coordinator
+        self._entry_id = entry_id
+        self._metric = metric
+        self._endpoint = endpoint
+        self.translation_key = metric
+        if endpoint is None:
+            self._attr_unique_id = f"{coordinator.host}_{metric}"
+        else:
+            self._attr_unique_id = f"{coordinator.host}_{metric}_{endpoint}"
+            self._attr_translation_placeholders = {"endpoint": endpoint}
+        if metric == "endpoint_errors":
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        elif metric == "connection_reuse":
+            self._attr_native_unit_of_measurement = PERCENTAGE
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        else:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.host)},
+            name="MyAir3 System",
+            manufacturer="Advantage Air",
+            model="MyAir3",
+        )
+
+    @property
+    def should_poll(self) -> bool:
+        """No polling needed, coordinator handles updates."""
+        return False
 
     @property
-    def native_value(self) -> int | None:
-        """Return the damper position percentage."""
-        return self.coordinator.data["zones"][self._zone_id]["userPercentSetting"]
+    def native_value(self) -> float | int | None:
+        """Return the metric value."""
+        metrics = self.coordinator.metrics
+        if self._metric == "poll_duration":
+            duration = metrics.poll_duration
+            return None if duration is None else round(duration * 1000, 1)
+        if self._metric == "connection_reuse":
+            rate = metrics.connections.reuse_rate
+            return None if rate is None else round(rate * 100, 1)
+        endpoint = metrics.endpoint(self._endpoint)
+        if self._metric == "endpoint_errors":
+            return endpoint.errors
+        latency = endpoint.latency_mean
+        return None if latency is None else round(latency * 1000, 1)
 
     async def async_added_to_hass(self):
-        """Connect to coordinator."""
+        """Connect to coordinator.
+
+        Metrics change on every request, so listen without a context to be
+        woken on every update.
+        """
         self.async_on_remove(
             self.coordinator.async_add_listener(self.async_write_ha_state)
         )
@@ -0,0 +1,147 @@
+"""Services for the MyAir3 integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import MyAir3Coordinator
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_NAME = "name"
+ATTR_ZONES = "zones"
+
+DEFAULT_SNAPSHOT_NAME = "default"
+
+SERVICE_RESTORE = "restore"
+SERVICE_SET_ZONES = "set_zones"
+SERVICE_SNAPSHOT = "snapshot"
+
+# set_zones fields -> setZoneData parameters
+ZONE_SERVICE_PARAMS = {
+    "power": "zoneSetting",
+    "temperature": "desiredTemp",
+    "damper": "userPercentSetting",
+}
+
+ZONE_SETTINGS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("power"): vol.All(cv.boolean, int),
+            vol.Optional("temperature"): vol.All(
+                vol.Coerce(float), vol.Range(min=16, max=32)
+            ),
+            vol.Optional("damper"): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+        }
+    ),
+    cv.has_at_least_one_key(*ZONE_SERVICE_PARAMS),
+)
+
+SET_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_ZONES): vol.All(
+            {vol.Coerce(int): ZONE_SETTINGS_SCHEMA}, vol.Length(min=1)
+        ),
+    }
+)
+
+SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_NAME, default=DEFAULT_SNAPSHOT_NAME): cv.string,
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> MyAir3Coordinator:
+    """Return the coordinator a service call targets.
+
+    config_entry_id may be left out when only one controller is set up.
+    """
+    coordinators: dict[str, MyAir3Coordinator] = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        if len(coordinators) != 1:
+            raise ServiceValidationError(
+                "config_entry_id is required when more than one MyAir3 system "
+                "is set up"
+            )
+        return next(iter(coordinators.values()))
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"No loaded MyAir3 system with entry {entry_id}")
+    return coordinators[entry_id]
+
+
+async def _async_set_zones(call: ServiceCall) -> ServiceResponse:
+    """Write several zones in one batch."""
+    coordinator = _get_coordinator(call.hass, call)
+    zones: dict[int, dict[str, Any]] = call.data[ATTR_ZONES]
+    if unknown := sorted(set(zones) - set(coordinator.data.zones)):
+        raise ServiceValidationError(f"Unknown zones: {unknown}")
+    results = await coordinator.set_zones(
+        {
+            zone: {
+                ZONE_SERVICE_PARAMS[field]: value for field, value in settings.items()
+            }
+            for zone, settings in zones.items()
+        }
+    )
+    return {"zones": {str(zone): success for zone, success in results.items()}}
+
+
+async def _async_snapshot(call: ServiceCall) -> None:
+    """Save the current settings under a name."""
+    coordinator = _get_coordinator(call.hass, call)
+    await coordinator.snapshot(call.data[ATTR_NAME])
+
+
+async def _async_restore(call: ServiceCall) -> ServiceResponse:
+    """Write back the settings that differ from a snapshot."""
+    coordinator = _get_coordinator(call.hass, call)
+    name = call.data[ATTR_NAME]
+    if name not in coordinator.snapshots:
+        raise ServiceValidationError(f"No snapshot named {name}")
+    results = await coordinator.restore_snapshot(name)
+    return {
+        "writes": {
+            "system" if target is None else str(target): success
+            for target, success in results.items()
+        }
+    }
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the MyAir3 services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        _async_set_zones,
+        schema=SET_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SNAPSHOT, _async_snapshot, schema=SNAPSHOT_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        _async_restore,
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1 @@
+"""Tests for the MyAir3 integration."""
@@ -0,0 +1,16 @@
+"""Fixtures for MyAir3 tests."""
+
+from collections.abc import Generator
+
+import pytest
+
+from .emulator import MyAir3Emulator
+
+
+@pytest.fixture
+def emulator(socket_enabled) -> Generator[MyAir3Emulator]:
+    """Run a stand-in MyAir3 controller on loopback."""
+    controller = MyAir3Emulator()
+    controller.start()
+    yield controller
+    controller.stop()
@@ -0,0 +1,247 @@
+"""Stand-in MyAir3 controller speaking the legacy XML protocol.
+
+The emulator runs an aiohttp server on its own event loop in a background
+thread, so CPU time measured on the test's event loop only covers the
+integration and not the fake controller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import random
+import threading
+import time
+
+from aiohttp import web
+
+ROOT_TAG = "iZS10.3"
+
+
+class MyAir3Emulator:
+    """Serve /login, /getSystemData, /getZoneData, /setSystemData and /setZoneData."""
+
+    def __init__(
+        self,
+        num_zones: int = 4,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        max_connections: int = 0,
+        session_ttl: float | None = None,
+        password: str = "password",
+        host: str = "127.0.0.1",
+    ) -> None:
+        """Initialize.
+
+        latency is added to every request, error_rate is the fraction of
+        requests answered with HTTP 500, max_connections (0 = unlimited) is
+        the number of requests served at once before answering HTTP 503 and
+        session_ttl is the number of seconds a login stays valid.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.max_connections = max_connections
+        self.session_ttl = session_ttl
+        self.password = password
+        self.failing_zones: set[int] = set()
+        self.requests: Counter[str] = Counter()
+        self.active_connections = 0
+        self.peak_connections = 0
+        self.system = {
+            "airconOnOff": 1,
+            "mode": 1,
+            "fanSpeed": 2,
+            "centralDesiredTemp": 22.0,
+            "centralActualTemp": 23.5,
+            "numberOfZones": num_zones,
+        }
+        self.zones = {
+            zone_id: {
+                "name": f"Zone {zone_id}",
+                "setting": 1,
+                "desiredTemp": 22.0,
+                "actualTemp": 21.0 + zone_id / 10,
+                "userPercentSetting": 50,
+                "hasLowBatt": 0,
+            }
+            for zone_id in range(1, num_zones + 1)
+        }
+        self._bind_host = host
+        self._logged_in_at: float | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self._port = 0
+
+    @property
+    def host(self) -> str:
+        """Return the host:port the integration should connect to."""
+        return f"{self._bind_host}:{self._port}"
+
+    @property
+    def request_count(self) -> int:
+        """Return the total number of requests served."""
+        return sum(self.requests.values())
+
+    def reset_counts(self) -> None:
+        """Clear request counters."""
+        self.requests.clear()
+        self.peak_connections = 0
+
+    def expire_session(self) -> None:
+        """Drop the current login as if the controller timed it out."""
+        self._logged_in_at = None
+
+    def set_num_zones(self, num_zones: int) -> None:
+        """Change the number of zones the controller reports."""
+        self.system["numberOfZones"] = num_zones
+        for zone_id in range(1, num_zones + 1):
+            self.zones.setdefault(
+                zone_id,
+                {
+                    "name": f"Zone {zone_id}",
+                    "setting": 1,
+                    "desiredTemp": 22.0,
+                    "actualTemp": 21.0,
+                    "userPercentSetting": 50,
+                    "hasLowBatt": 0,
+                },
+            )
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._async_start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="myair3-emulator")
+        self._thread.start()
+        started.wait()
+
+    def stop(self) -> None:
+        """Stop serving and join the background thread."""
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+        self._thread = None
+
+    async def _async_start(self) -> None:
+        """Bind the aiohttp server."""
+        app = web.Application()
+        app.router.add_get("/login", self._handle_login)
+        app.router.add_get("/getSystemData", self._handle_get_system)
+        app.router.add_get("/getZoneData", self._handle_get_zone)
+        app.router.add_get("/setSystemData", self._handle_set_system)
+        app.router.add_get("/setZoneData", self._handle_set_zone)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._bind_host, 0)
+        await site.start()
+        self._port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+
+    async def _serve(self, request: web.Request, handler) -> web.Response:
+        """Apply latency, connection cap and error injection to a request."""
+        self.requests[request.path.lstrip("/")] += 1
+        if self.max_connections and self.active_connections >= self.max_connections:
+            return web.Response(status=503)
+        self.active_connections += 1
+        self.peak_connections = max(self.peak_connections, self.active_connections)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.error_rate and random.random() < self.error_rate:
+                return web.Response(status=500)
+            body = handler(request)
+            if isinstance(body, web.Response):
+                return body
+            return web.Response(
+                text=f'<?xml version="1.0" encoding="UTF-8"?>\n'
+                f"<{ROOT_TAG}><request>{request.path.lstrip('/')}</request>"
+                f"{body}</{ROOT_TAG}>",
+                content_type="text/xml",
+            )
+        finally:
+            self.active_connections -= 1
+
+    def _authenticated(self) -> bool:
+        """Return whether the current login is still valid."""
+        if self._logged_in_at is None:
+            return False
+        if self.session_ttl is None:
+            return True
+        return time.monotonic() - self._logged_in_at < self.session_ttl
+
+    def _require_login(self, handler):
+        """Answer with an expired session marker when not logged in."""
+
+        def wrapped(request: web.Request):
+            if not self._authenticated():
+                return "<authenticated>0</authenticated>"
+            return handler(request)
+
+        return wrapped
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        def login(request: web.Request) -> str:
+            if request.query.get("password") != self.password:
+                return "<authenticated>0</authenticated>"
+            self._logged_in_at = time.monotonic()
+            return "<authenticated>1</authenticated>"
+
+        return await self._serve(request, login)
+
+    async def _handle_get_system(self, request: web.Request) -> web.Response:
+        def get_system(request: web.Request) -> str:
+            fields = "".join(
+                f"<{key}>{value}</{key}>" for key, value in self.system.items()
+            )
+            return (
+                "<authenticated>1</authenticated><system>"
+                f"<unitcontrol>{fields}</unitcontrol></system>"
+            )
+
+        return await self._serve(request, self._require_login(get_system))
+
+    async def _handle_get_zone(self, request: web.Request) -> web.Response:
+        def get_zone(request: web.Request) -> str | web.Response:
+            zone_id = int(request.query["zone"])
+            if zone_id in self.failing_zones:
+                return web.Response(status=500)
+            zone = self.zones.get(zone_id)
+            if zone is None:
+                return "<authenticated>1</authenticated>"
+            fields = "".join(f"<{key}>{value}</{key}>" for key, value in zone.items())
+            return f"<authenticated>1</authenticated><zone{zone_id}>{fields}</zone{zone_id}>"
+
+        return await self._serve(request, self._require_login(get_zone))
+
+    async def _handle_set_system(self, request: web.Request) -> web.Response:
+        def set_system(request: web.Request) -> str:
+            for key, value in request.query.items():
+                if key in self.system:
+                    self.system[key] = type(self.system[key])(float(value))
+            return "<ack>1</ack>"
+
+        return await self._serve(request, self._require_login(set_system))
+
+    async def _handle_set_zone(self, request: web.Request) -> web.Response:
+        def set_zone(request: web.Request) -> str:
+            zone = self.zones.get(int(request.query.get("zone", "0")))
+            if zone is None:
+                return "<ack>0</ack>"
+            for key, value in request.query.items():
+                field = "setting" if key == "zoneSetting" else key
+                if field in zone and field != "name":
+                    zone[field] = type(zone[field])(float(value))
+            return "<ack>1</ack>"
+
+        return await self._serve(request, self._require_login(set_zone))
@@ -0,0 +1,219 @@
+"""Poll and command benchmarks against the emulated controller.
+
+Run with ``pytest tests/test_benchmark.py -s`` to see the report. Each
+scenario prints wall-clock latency, requests sent to the controller and CPU
+time spent on Home Assistant's event loop thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import time
+import timeit
+
+from defusedxml.ElementTree import fromstring
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.myair3 import MyAir3Coordinator
+from custom_components.myair3.capture import CaptureWriter, ReplaySession, load_capture
+from custom_components.myair3.models import SystemState, ZoneState
+from custom_components.myair3.parser import parse_system, parse_zone
+
+from .emulator import MyAir3Emulator
+
+ROUNDS = 5
+PARSE_ROUNDS = 5000
+
+# Real controllers send many more fields than the integration reads
+_FILLER = "".join(f"<field{index}>{index}</field{index}>" for index in range(30))
+SYSTEM_BODY = (
+    '<?xml version="1.0" encoding="UTF-8"?><iZS10.3><request>getSystemData'
+    f"</request><authenticated>1</authenticated><system>{_FILLER}<unitcontrol>"
+    "<airconOnOff>1</airconOnOff><fanSpeed>2</fanSpeed><mode>1</mode>"
+    f"{_FILLER}<centralActualTemp>23.5</centralActualTemp>"
+    "<centralDesiredTemp>22.0</centralDesiredTemp><numberOfZones>10</numberOfZones>"
+    "</unitcontrol></system></iZS10.3>"
+).encode()
+ZONE_BODY = (
+    '<?xml version="1.0" encoding="UTF-8"?><iZS10.3><request>getZoneData'
+    "</request><authenticated>1</authenticated><zone3><name>Kitchen</name>"
+    "<setting>1</setting><userPercentSetting>45</userPercentSetting>"
+    "<desiredTemp>21.5</desiredTemp><actualTemp>22.3</actualTemp>"
+    "<hasLowBatt>0</hasLowBatt></zone3></iZS10.3>"
+).encode()
+
+
+@dataclass
+class BenchResult:
+    """Averaged measurements for one scenario."""
+
+    name: str
+    latency_ms: float
+    requests: float
+    cpu_ms: float
+
+    def __str__(self) -> str:
+        """Format as a report line."""
+        return (
+            f"{self.name:<40} {self.latency_ms:>9.1f} ms {self.requests:>6.1f} req"
+            f" {self.cpu_ms:>8.2f} ms cpu"
+        )
+
+
+async def measure(
+    name: str,
+    emulator: MyAir3Emulator,
+    action: Callable[[], Awaitable[object]],
+    rounds: int = ROUNDS,
+) -> BenchResult:
+    """Run action a number of times and average the measurements."""
+    emulator.reset_counts()
+    wall = cpu = 0.0
+    for _ in range(rounds):
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        await action()
+        cpu += time.thread_time() - cpu_start
+        wall += time.perf_counter() - wall_start
+    result = BenchResult(
+        name,
+        latency_ms=wall / rounds * 1000,
+        requests=emulator.request_count / rounds,
+        cpu_ms=cpu / rounds * 1000,
+    )
+    print(result)  # noqa: T201
+    return result
+
+
+@pytest.mark.parametrize("zone_concurrency", [1, 2, 4, 0])
+async def test_bench_poll(
+    hass: HomeAssistant, emulator: MyAir3Emulator, zone_concurrency: int
+) -> None:
+    """Benchmark a full poll of a 10-zone controller with 20ms latency."""
+    emulator.set_num_zones(10)
+    emulator.latency = 0.02
+    coordinator = MyAir3Coordinator(
+        hass,
+        emulator.host,
+        "password",
+        zone_concurrency=zone_concurrency,
+        request_limit=0,
+    )
+    await coordinator.async_refresh()
+
+    result = await measure(
+        f"poll 10 zones concurrency={zone_concurrency}",
+        emulator,
+        coordinator.async_refresh,
+    )
+
+    assert coordinator.last_update_success
+    assert result.requests == 11
+
+
+async def test_bench_commands(hass: HomeAssistant, emulator: MyAir3Emulator) -> None:
+    """Benchmark the request cost of system and zone commands."""
+    emulator.set_num_zones(10)
+    emulator.latency = 0.02
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    await measure(
+        "set_system_temp", emulator, lambda: coordinator.set_system_temp(23)
+    )
+    await measure(
+        "set_zone_temp", emulator, lambda: coordinator.set_zone_temp(3, 23)
+    )
+    await measure(
+        "set_zone_power", emulator, lambda: coordinator.set_zone_power(3, 1)
+    )
+    await measure(
+        "set_zone_temp x4 batched",
+        emulator,
+        lambda: asyncio.gather(
+            *(coordinator.set_zone_temp(zone, 23) for zone in range(1, 5))
+        ),
+    )
+
+
+async def test_bench_replay_poll(
+    hass: HomeAssistant, emulator: MyAir3Emulator, tmp_path
+) -> None:
+    """Benchmark the parse and update path on a replayed 10-zone poll."""
+    emulator.set_num_zones(10)
+    path = tmp_path / "capture.jsonl"
+    recorder = MyAir3Coordinator(
+        hass, emulator.host, "password", capture=CaptureWriter(hass, path)
+    )
+    await recorder.async_refresh()
+    await hass.async_block_till_done()
+    replay = ReplaySession(await hass.async_add_executor_job(load_capture, path))
+    coordinator = MyAir3Coordinator(hass, "replay", "password", session=replay)
+    await coordinator.async_refresh()
+
+    result = await measure(
+        "replayed poll 10 zones", emulator, coordinator.async_refresh, rounds=50
+    )
+
+    assert coordinator.data == recorder.data
+    assert result.requests == 0
+
+
+def _findtext_parse_system(body: bytes) -> tuple[SystemState, int]:
+    """Parse getSystemData the way the coordinator used to."""
+    unitcontrol = fromstring(body.decode("utf-8").encode("utf-8")).find(
+        ".//unitcontrol"
+    )
+    return SystemState(
+        aircon_on_off=int(unitcontrol.findtext("airconOnOff", "0") or "0"),
+        mode=int(unitcontrol.findtext("mode", "1") or "1"),
+        fan_speed=int(unitcontrol.findtext("fanSpeed", "1") or "1"),
+        central_desired_temp=float(
+            unitcontrol.findtext("centralDesiredTemp", "20") or "20"
+        ),
+        central_actual_temp=float(
+            unitcontrol.findtext("centralActualTemp", "20") or "20"
+        ),
+    ), int(unitcontrol.findtext("numberOfZones", "0") or "0")
+
+
+def _findtext_parse_zone(body: bytes, zone_id: int) -> ZoneState:
+    """Parse getZoneData the way the coordinator used to."""
+    zone_elem = fromstring(body.decode("utf-8").encode("utf-8")).find(
+        f".//zone{zone_id}"
+    )
+    return ZoneState(
+        name=zone_elem.findtext("name", f"Zone {zone_id}") or f"Zone {zone_id}",
+        setting=int(zone_elem.findtext("setting", "0") or "0"),
+        desired_temp=float(zone_elem.findtext("desiredTemp", "20") or "20"),
+        actual_temp=float(zone_elem.findtext("actualTemp", "20") or "20"),
+        user_percent_setting=int(
+            zone_elem.findtext("userPercentSetting", "0") or "0"
+        ),
+        has_low_batt=int(zone_elem.findtext("hasLowBatt", "0") or "0") == 1,
+    )
+
+
+def _bench_parse(name: str, func: Callable[[], object]) -> float:
+    """Time a parser and print microseconds per call."""
+    per_call = timeit.timeit(func, number=PARSE_ROUNDS) / PARSE_ROUNDS * 1e6
+    print(f"{name:<40} {per_call:>9.1f} us")  # noqa: T201
+    return per_call
+
+
+def test_bench_parse_system() -> None:
+    """Compare the single-pass system parser with the findtext chain."""
+    assert parse_system(SYSTEM_BODY) == _findtext_parse_system(SYSTEM_BODY)
+    _bench_parse("parse getSystemData findtext", lambda: _findtext_parse_system(SYSTEM_BODY))
+    _bench_parse("parse getSystemData single pass", lambda: parse_system(SYSTEM_BODY))
+
+
+def test_bench_parse_zone() -> None:
+    """Compare the single-pass zone parser with the findtext chain."""
+    assert parse_zone(ZONE_BODY, 3) == _findtext_parse_zone(ZONE_BODY, 3)
+    _bench_parse("parse getZoneData findtext", lambda: _findtext_parse_zone(ZONE_BODY, 3))
+    _bench_parse("parse getZoneData single pass", lambda: parse_zone(ZONE_BODY, 3))
@@ -0,0 +1,42 @@
+"""Tests for capturing and replaying controller traffic."""
+
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.myair3 import MyAir3Coordinator
+from custom_components.myair3.capture import (
+    CaptureWriter,
+    ReplaySession,
+    load_capture,
+)
+
+from .emulator import MyAir3Emulator
+
+
+async def test_capture_and_replay(
+    hass: HomeAssistant, emulator: MyAir3Emulator, tmp_path: Path
+) -> None:
+    """Test a captured poll replays into identical data without the password."""
+    path = tmp_path / "capture.jsonl"
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "secret", capture=CaptureWriter(hass, path)
+    )
+    emulator.password = "secret"
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert "secret" not in path.read_text()
+    exchanges = await hass.async_add_executor_job(load_capture, path)
+    assert [exchange["url"] for exchange in exchanges[:2]] == [
+        "/login?password=%2A%2AREDACTED%2A%2A",
+        "/getSystemData",
+    ]
+
+    replay = ReplaySession(exchanges)
+    replayed = MyAir3Coordinator(hass, "replay", "other", session=replay)
+    await replayed.async_refresh()
+
+    assert replayed.last_update_success
+    assert replayed.data == coordinator.data
+    assert replay.requests == len(exchanges)
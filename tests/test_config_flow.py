@@ -3,7 +3,9 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 
 
@@ -80,3 +82,25 @@ async def test_user_flow_duplicate_entry(hass: HomeAssistant) -> None:
         )
         assert result.get("type") == "abort"
         assert result.get("reason") == "already_configured"
+
+
+async def test_options_flow_keeps_options_password(hass: HomeAssistant) -> None:
+    """Test the options form starts from the password saved in options."""
+    entry = MockConfigEntry(
+        domain="myair3",
+        data={CONF_HOST: "192.168.1.100", CONF_PASSWORD: "old"},
+        options={CONF_PASSWORD: "new"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result.get("type") == "form"
+    password = next(key for key in result["data_schema"].schema if key == CONF_PASSWORD)
+    assert password.default() == "new"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_SCAN_INTERVAL: 60}
+    )
+    assert result.get("type") == "create_entry"
+    assert entry.options[CONF_PASSWORD] == "new"
+    assert entry.options[CONF_SCAN_INTERVAL] == 60
@@ -0,0 +1,702 @@
+"""Tests for the MyAir3 coordinator against the emulated controller."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiohttp
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from custom_components.myair3 import MyAir3Coordinator, _coordinator_settings
+from custom_components.myair3.const import (
+    CONF_REQUEST_LIMIT,
+    DOMAIN,
+    STORAGE_VERSION,
+    ZONE_REMOVAL_POLLS,
+)
+from custom_components.myair3.models import state_as_dict, system_keys, zone_keys
+from custom_components.myair3.resilience import BREAKER_THRESHOLD, RETRY_ATTEMPTS
+
+from .emulator import MyAir3Emulator
+
+
+async def test_poll_parses_system_and_zones(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a poll returns system data and every zone."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.aircon_on_off == 1
+    assert coordinator.data.central_desired_temp == 22.0
+    assert list(coordinator.data.zones) == [1, 2, 3, 4]
+    assert coordinator.data.zones[2].actual_temp == 21.2
+    assert coordinator.data.zones[2].temp_sensor_available
+
+
+async def test_concurrent_zone_fetch_matches_sequential(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test every concurrency cap produces the same zones."""
+    emulator.set_num_zones(10)
+    emulator.latency = 0.01
+    results = {}
+    for concurrency in (1, 2, 4, 0):
+        coordinator = MyAir3Coordinator(
+            hass, emulator.host, "password", zone_concurrency=concurrency
+        )
+        emulator.reset_counts()
+        await coordinator.async_refresh()
+        results[concurrency] = coordinator.data.zones
+        if concurrency:
+            assert emulator.peak_connections <= concurrency
+
+    assert results[2] == results[1]
+    assert results[4] == results[1]
+    assert results[0] == results[1]
+
+
+async def test_session_reused_between_polls(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test login happens once and again only after the session expires."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+    assert emulator.requests["login"] == 1
+
+    emulator.expire_session()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert emulator.requests["login"] == 2
+    assert coordinator.relogin_count == 1
+    assert coordinator.last_session_duration is not None
+
+
+async def test_concurrent_requests_share_one_relogin(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test requests that all find the session expired log in only once."""
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "password", zone_concurrency=0, request_limit=0
+    )
+    await coordinator.async_refresh()
+    emulator.expire_session()
+    emulator.reset_counts()
+
+    await coordinator.async_refresh_partial(zone_ids=[1, 2, 3, 4])
+
+    assert coordinator.last_update_success
+    assert emulator.requests["login"] == 1
+    assert coordinator.relogin_count == 1
+
+
+async def test_set_system_temp(hass: HomeAssistant, emulator: MyAir3Emulator) -> None:
+    """Test a command reaches the controller and is reflected in data."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    await coordinator.set_system_temp(24.5)
+
+    assert emulator.system["centralDesiredTemp"] == 24.5
+    assert coordinator.data.central_desired_temp == 24.5
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test the polling tier follows commands and system power."""
+    coordinator = MyAir3Coordinator(
+        hass,
+        emulator.host,
+        "password",
+        scan_interval=30,
+        fast_scan_interval=5,
+        fast_poll_window=60,
+        idle_scan_interval=300,
+    )
+    await coordinator.async_refresh()
+    assert coordinator.update_interval.total_seconds() == 30
+
+    emulator.system["airconOnOff"] = 0
+    await coordinator.async_refresh()
+    assert coordinator.update_interval.total_seconds() == 300
+
+    await coordinator.set_system_power(1)
+    assert coordinator.update_interval.total_seconds() == 5
+
+
+async def test_commands_are_merged_into_one_batch(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test concurrent writes share one request per target and one refresh."""
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "password", optimistic=False
+    )
+    await coordinator.async_refresh()
+    emulator.reset_counts()
+
+    await asyncio.gather(
+        coordinator.set_system_power(0),
+        coordinator.set_hvac_mode(2),
+        coordinator.set_system_temp(23),
+        coordinator.set_system_temp(25),
+        coordinator.set_zone_power(1, 0),
+        coordinator.set_zone_temp(1, 19),
+    )
+
+    assert emulator.requests["setSystemData"] == 1
+    assert emulator.requests["setZoneData"] == 1
+    assert emulator.requests["getSystemData"] == 1
+    assert emulator.system["airconOnOff"] == 0
+    assert emulator.system["mode"] == 2
+    assert emulator.system["centralDesiredTemp"] == 25
+    assert emulator.zones[1]["setting"] == 0
+    assert emulator.zones[1]["desiredTemp"] == 19
+
+
+async def test_command_queued_during_flush_is_sent(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a write queued while a batch is being sent goes out next."""
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "password", optimistic=False
+    )
+    await coordinator.async_refresh()
+    emulator.latency = 0.2
+
+    first = hass.async_create_task(coordinator.set_system_power(0))
+    while not emulator.requests["setSystemData"]:
+        await asyncio.sleep(0.01)
+    second = hass.async_create_task(coordinator.set_fan_speed(3))
+
+    await asyncio.wait_for(asyncio.gather(first, second), timeout=10)
+    assert emulator.requests["setSystemData"] == 2
+    assert emulator.system["airconOnOff"] == 0
+    assert emulator.system["fanSpeed"] == 3
+
+
+async def test_cancelled_command_does_not_block_batch(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test cancelling one caller leaves the rest of its batch unaffected."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    cancelled = hass.async_create_task(coordinator.set_zone_temp(1, 19))
+    other = hass.async_create_task(coordinator.set_zone_temp(2, 18))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    await asyncio.wait_for(other, timeout=10)
+    assert cancelled.cancelled()
+    assert emulator.zones[2]["desiredTemp"] == 18.0
+
+
+async def test_optimistic_write_skips_refresh(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test an acknowledged write is applied without polling the controller."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    emulator.reset_counts()
+
+    await coordinator.set_zone_temp(2, 18.5)
+
+    assert emulator.request_count == 1
+    assert coordinator.data.zones[2].desired_temp == 18.5
+
+
+async def test_optimistic_write_rolled_back(
+    hass: HomeAssistant, emulator: MyAir3Emulator, caplog
+) -> None:
+    """Test the next poll rolls back a write the controller did not keep."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    await coordinator.set_fan_speed(3)
+    assert coordinator.data.fan_speed == 3
+
+    emulator.system["fanSpeed"] = 1
+    await coordinator.async_refresh()
+
+    assert coordinator.data.fan_speed == 1
+    assert "rolling back" in caplog.text
+
+
+async def test_partial_refresh_survives_client_errors(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test aiohttp errors during a partial refresh end in a failed update."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    with patch.object(
+        coordinator, "_fetch_zones", side_effect=aiohttp.ServerDisconnectedError()
+    ):
+        await coordinator.async_refresh_partial(zone_ids=[1])
+
+    assert not coordinator.last_update_success
+
+
+async def test_write_during_poll_kept_over_polled_data(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a poll that read the old value does not undo a newer write."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    emulator.reset_counts()
+    emulator.latency = 0.2
+
+    refresh = hass.async_create_task(coordinator.async_refresh())
+    # getSystemData has been answered once zones are being fetched
+    while not emulator.requests["getZoneData"]:
+        await asyncio.sleep(0.01)
+    await coordinator.set_system_power(0)
+    await refresh
+
+    assert coordinator.data.aircon_on_off == 0
+    assert emulator.system["airconOnOff"] == 0
+
+    emulator.latency = 0
+    await coordinator.async_refresh()
+    assert coordinator.data.aircon_on_off == 0
+
+
+async def test_partial_refresh_only_fetches_and_notifies_changes(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a zone refresh costs one request and wakes only changed inputs."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    calls = []
+    for name, keys in (
+        ("system", system_keys()),
+        ("zone 1", zone_keys(1)),
+        ("zone 3 actual", zone_keys(3, "actual_temp")),
+        ("zone 3 target", zone_keys(3, "desired_temp")),
+    ):
+        coordinator.async_add_listener(lambda name=name: calls.append(name), keys)
+    emulator.reset_counts()
+    emulator.zones[3]["actualTemp"] = 25.0
+
+    await coordinator.async_refresh_partial(zone_ids=[3])
+
+    assert dict(emulator.requests) == {"getZoneData": 1}
+    assert coordinator.data.zones[3].actual_temp == 25.0
+    assert calls == ["zone 3 actual"]
+    assert coordinator.listener_updates_skipped == 3
+    await coordinator.async_shutdown()
+
+
+async def test_unchanged_poll_skips_listeners(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a poll that changes nothing wakes no entity."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append("system"), system_keys())
+    coordinator.async_add_listener(lambda: calls.append("zone"), zone_keys(2))
+
+    await coordinator.async_refresh()
+    assert calls == []
+
+    emulator.system["centralActualTemp"] = 19.0
+    await coordinator.async_refresh()
+    assert calls == ["system"]
+    await coordinator.async_shutdown()
+
+
+async def test_tiered_zone_polling(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test zones rotate with bounded staleness and changed zones go first."""
+    emulator.set_num_zones(10)
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", zones_per_poll=3)
+    await coordinator.async_refresh()
+
+    for zone in emulator.zones.values():
+        zone["actualTemp"] = 30.0
+    for _ in range(4):
+        emulator.reset_counts()
+        await coordinator.async_refresh()
+        assert emulator.requests["getZoneData"] == 3
+        assert emulator.requests["getSystemData"] == 1
+    assert all(zone.actual_temp == 30.0 for zone in coordinator.data.zones.values())
+
+    emulator.zones[7]["desiredTemp"] = 18.0
+    for _ in range(4):
+        await coordinator.async_refresh()
+        if coordinator.data.zones[7].desired_temp == 18.0:
+            break
+    assert coordinator.data.zones[7].desired_temp == 18.0
+
+    # The adjusted zone is fetched again on top of the rotation
+    emulator.reset_counts()
+    await coordinator.async_refresh()
+    assert emulator.requests["getZoneData"] == 4
+
+
+async def test_request_metrics(hass: HomeAssistant, emulator: MyAir3Emulator) -> None:
+    """Test requests and polls are counted per endpoint."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+
+    metrics = coordinator.metrics
+    assert metrics.polls == 1
+    assert metrics.poll_duration is not None
+    assert metrics.endpoints["login"].requests == 1
+    assert metrics.endpoints["getZoneData"].requests == 4
+    assert metrics.endpoints["getZoneData"].bytes > 0
+    assert sum(metrics.endpoints["getZoneData"].histogram) == 4
+
+    emulator.error_rate = 1.0
+    await coordinator.async_refresh()
+    assert metrics.poll_failures == 1
+    # The failed read is retried before the poll gives up
+    assert metrics.endpoints["getSystemData"].errors == 1 + RETRY_ATTEMPTS
+
+
+async def test_failing_zone_does_not_fail_poll(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a failing zone keeps its last state and only it goes unavailable."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", zone_max_age=0)
+    await coordinator.async_refresh()
+    emulator.failing_zones.add(2)
+    emulator.zones[2]["actualTemp"] = 30.0
+    emulator.zones[1]["actualTemp"] = 30.0
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.zones[1].actual_temp == 30.0
+    assert coordinator.data.zones[2].actual_temp == 21.2
+    assert coordinator.zone_available(1)
+    assert not coordinator.zone_available(2)
+
+    emulator.failing_zones.clear()
+    await coordinator.async_refresh()
+    assert coordinator.zone_available(2)
+
+
+async def test_zone_missing_from_response_ages_out(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a zone left out of its getZoneData response goes unavailable."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", zone_max_age=0)
+    await coordinator.async_refresh()
+    del emulator.zones[2]
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.zones[2].actual_temp == 21.2
+    assert not coordinator.zone_available(2)
+    assert coordinator.zone_available(1)
+
+
+async def test_state_restored_from_cache(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a cached state is served until the first live poll."""
+    store = Store(hass, STORAGE_VERSION, "myair3.test")
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", store=store)
+    await coordinator.async_refresh()
+    await store.async_save(state_as_dict(coordinator.data))
+    emulator.zones[1]["actualTemp"] = 30.0
+    emulator.reset_counts()
+
+    restarted = MyAir3Coordinator(hass, emulator.host, "password", store=store)
+    assert await restarted.async_restore()
+
+    assert restarted.restored
+    assert restarted.data == coordinator.data
+    assert emulator.request_count == 0
+
+    await restarted.async_refresh()
+    assert not restarted.restored
+    assert restarted.data.zones[1].actual_temp == 30.0
+
+
+async def test_set_zones_single_batch(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test several zones are written in one batch with per-zone results."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", optimistic=False)
+    await coordinator.async_refresh()
+    emulator.reset_counts()
+
+    results = await coordinator.set_zones(
+        {
+            1: {"desiredTemp": 24.0},
+            2: {"zoneSetting": 0},
+            3: {"userPercentSetting": 30},
+        }
+    )
+
+    assert results == {1: True, 2: True, 3: True}
+    assert emulator.requests["setZoneData"] == 3
+    assert emulator.requests["getZoneData"] == 3
+    assert emulator.requests["getSystemData"] == 0
+    assert coordinator.data.zones[1].desired_temp == 24.0
+    assert coordinator.data.zones[2].setting == 0
+    assert coordinator.data.zones[3].user_percent_setting == 30
+
+
+async def test_set_zones_skips_settings_already_in_place(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test zones already in the requested state are not written."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password", optimistic=False)
+    await coordinator.async_refresh()
+    emulator.reset_counts()
+
+    results = await coordinator.set_zones(
+        {
+            1: {"desiredTemp": 22.0, "zoneSetting": 1},
+            2: {"desiredTemp": 18.0, "zoneSetting": 1},
+        }
+    )
+
+    assert results == {1: True, 2: True}
+    assert emulator.requests["setZoneData"] == 1
+    assert emulator.zones[2]["desiredTemp"] == 18.0
+
+
+async def test_snapshot_restore_writes_only_differences(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test restoring a snapshot only writes the settings that changed."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    await coordinator.snapshot("default")
+    await coordinator.set_zones({2: {"desiredTemp": 18.0}})
+    await coordinator.set_system_temp(25)
+    emulator.reset_counts()
+
+    results = await coordinator.restore_snapshot("default")
+
+    assert results == {None: True, 2: True}
+    assert emulator.requests["setSystemData"] == 1
+    assert emulator.requests["setZoneData"] == 1
+    assert emulator.zones[2]["desiredTemp"] == 22.0
+    assert emulator.system["centralDesiredTemp"] == 22.0
+
+    emulator.reset_counts()
+    assert await coordinator.restore_snapshot("default") == {}
+    assert emulator.request_count == 0
+
+
+async def test_dedicated_session_reuses_connections(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test the per-controller pool keeps connections alive between requests."""
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "password", dedicated_session=True
+    )
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    connections = coordinator.metrics.connections
+    assert connections.created == 1
+    assert connections.reused == emulator.request_count - 1
+
+    await coordinator.async_shutdown()
+    assert coordinator.session.closed
+
+
+async def test_dedicated_session_closed_on_stop(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test the per-controller pool is closed when Home Assistant stops."""
+    coordinator = MyAir3Coordinator(
+        hass, emulator.host, "password", dedicated_session=True
+    )
+    await coordinator.async_refresh()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert coordinator.session.closed
+
+
+async def test_failed_zone_request_retried(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a failing getZoneData is retried before the zone is marked failing."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    emulator.failing_zones.add(2)
+    emulator.reset_counts()
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert emulator.requests["getZoneData"] == 4 + 2
+    assert coordinator.retry_count == 2
+    assert not coordinator.breaker.is_open
+
+
+async def test_failing_zones_do_not_open_breaker(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test zones answering with errors do not hold back the next poll."""
+    emulator.set_num_zones(BREAKER_THRESHOLD + 1)
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    emulator.failing_zones.update(range(1, BREAKER_THRESHOLD + 1))
+
+    await coordinator.async_refresh()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert not coordinator.breaker.is_open
+    assert coordinator.zone_available(BREAKER_THRESHOLD + 1)
+
+
+async def test_unchanged_responses_reuse_parsed_data(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test byte-identical responses are not parsed again."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    first = coordinator.data
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data is first
+    assert coordinator.parse_cache.hits["getSystemData"] == 1
+    assert coordinator.parse_cache.hits["getZoneData"] == 4
+
+    emulator.zones[3]["actualTemp"] = 30.0
+    await coordinator.async_refresh()
+
+    assert coordinator.data is not first
+    assert coordinator.data.zones[1] is first.zones[1]
+    assert coordinator.data.zones[3].actual_temp == 30.0
+    assert coordinator.parse_cache.misses["getZoneData"] == 5
+
+
+async def test_apply_settings_keeps_data(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test changed options apply in place and a new password logs in again."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    data = coordinator.data
+
+    emulator.password = "secret"
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: emulator.host},
+        options={
+            CONF_PASSWORD: "secret",
+            CONF_SCAN_INTERVAL: 45,
+            CONF_REQUEST_LIMIT: 2,
+        },
+    )
+    coordinator.async_apply_settings(**_coordinator_settings(hass, entry))
+
+    assert coordinator.data is data
+    assert coordinator.update_interval == timedelta(seconds=45)
+    assert coordinator.scheduler.limit == 2
+
+    emulator.reset_counts()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert emulator.requests["login"] == 1
+
+
+async def test_zone_entities_follow_reported_zones(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test zone entities are added, renamed and dropped as zones change."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    created: list[int] = []
+    entities: dict[int, Mock] = {}
+    added: list[Mock] = []
+
+    def create_entities(zone_id: int) -> list[Mock]:
+        created.append(zone_id)
+        entities[zone_id] = Mock(registry_entry=None, hass=None)
+        return [entities[zone_id]]
+
+    unsub = coordinator.async_add_zone_entities(create_entities, added.extend)
+    assert created == [1, 2, 3, 4]
+
+    emulator.set_num_zones(6)
+    emulator.zones[2]["name"] = "Study"
+    await coordinator.async_refresh()
+
+    assert created == [1, 2, 3, 4, 5, 6]
+    assert added == [entities[zone_id] for zone_id in created]
+    entities[2].async_set_zone_name.assert_called_once_with("Study")
+    entities[1].async_set_zone_name.assert_not_called()
+
+    emulator.set_num_zones(3)
+    await coordinator.async_refresh()
+    assert list(coordinator.data.zones) == [1, 2, 3]
+
+    emulator.set_num_zones(4)
+    await coordinator.async_refresh()
+    assert created == [1, 2, 3, 4, 5, 6, 4]
+    unsub()
+
+
+async def test_zone_registry_entries_survive_transient_zero_zones(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a poll without zones keeps registry entries until zones stay gone."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    registry = er.async_get(hass)
+    created: list[int] = []
+
+    def create_entities(zone_id: int) -> list[Mock]:
+        created.append(zone_id)
+        entry = registry.async_get_or_create("climate", DOMAIN, f"zone_{zone_id}")
+        return [Mock(hass=hass, entity_id=entry.entity_id, async_remove=AsyncMock())]
+
+    unsub = coordinator.async_add_zone_entities(create_entities, lambda _: None)
+    entity_ids = {
+        zone_id: registry.async_get_entity_id("climate", DOMAIN, f"zone_{zone_id}")
+        for zone_id in created
+    }
+
+    # Controller restarting: one poll reports no zones
+    emulator.set_num_zones(0)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.data.zones == {}
+    assert all(registry.async_get(entity_id) for entity_id in entity_ids.values())
+
+    emulator.set_num_zones(4)
+    await coordinator.async_refresh()
+    assert created == [1, 2, 3, 4, 1, 2, 3, 4]
+    assert all(registry.async_get(entity_id) for entity_id in entity_ids.values())
+
+    # Zone 4 removed for good
+    emulator.set_num_zones(3)
+    for _ in range(ZONE_REMOVAL_POLLS - 1):
+        await coordinator.async_refresh()
+    assert registry.async_get(entity_ids[4]) is not None
+    await coordinator.async_refresh()
+    assert registry.async_get(entity_ids[4]) is None
+    assert registry.async_get(entity_ids[3]) is not None
+    unsub()
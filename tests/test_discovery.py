@@ -0,0 +1,82 @@
+"""Tests for MyAir3 controller discovery."""
+
+import socket
+
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.myair3.discovery import (
+    async_discover,
+    async_probe,
+    is_myair3_response,
+    looks_like_myair3,
+    scan_hosts,
+)
+
+from .emulator import MyAir3Emulator
+
+
+def test_fingerprint() -> None:
+    """Test only getSystemData responses with a unitcontrol block match."""
+    assert is_myair3_response(
+        b"<iZS10.3><system><unitcontrol><mode>1</mode></unitcontrol></system>"
+        b"</iZS10.3>"
+    )
+    assert not is_myair3_response(b"<html><body>router</body></html>")
+    assert not is_myair3_response(b"not xml")
+
+
+def test_unauthenticated_fingerprint() -> None:
+    """Test a controller's answer before login is recognised."""
+    assert looks_like_myair3(
+        b"<iZS10.3><request>getSystemData</request>"
+        b"<authenticated>0</authenticated></iZS10.3>"
+    )
+    assert not looks_like_myair3(b"<html><body>login</body></html>")
+    assert not looks_like_myair3(b"not xml")
+
+
+def test_scan_hosts() -> None:
+    """Test networks expand to host strings with a port suffix."""
+    assert scan_hosts("10.0.0.0/30") == ["10.0.0.1", "10.0.0.2"]
+    assert scan_hosts("10.0.0.5/32", 8080) == ["10.0.0.5:8080"]
+
+
+async def test_discover_finds_emulator(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a scan finds the controller and skips configured hosts."""
+    session = async_get_clientsession(hass)
+    port = int(emulator.host.rsplit(":", 1)[1])
+
+    assert await async_discover(session, "127.0.0.1/32", port) == [emulator.host]
+    assert (
+        await async_discover(session, "127.0.0.1/32", port, exclude=[emulator.host])
+        == []
+    )
+
+
+async def test_probe_fails_fast(hass: HomeAssistant, socket_enabled) -> None:
+    """Test probing a closed port returns False instead of raising."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    assert not await async_probe(async_get_clientsession(hass), f"127.0.0.1:{port}")
+
+
+async def test_probe_keeps_password_from_other_hosts(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a host that is not a controller never receives the password."""
+    aioclient_mock.get(
+        "http://10.0.0.5/getSystemData", text="<html><body>router</body></html>"
+    )
+
+    assert not await async_probe(async_get_clientsession(hass), "10.0.0.5", "secret")
+    assert aioclient_mock.call_count == 1
+    assert all("login" not in str(call[1]) for call in aioclient_mock.mock_calls)
@@ -0,0 +1,57 @@
+"""Tests for MyAir3 request timeouts and circuit breaking."""
+
+import pytest
+
+from custom_components.myair3 import resilience
+from custom_components.myair3.resilience import (
+    BREAKER_COOLDOWN,
+    BREAKER_THRESHOLD,
+    MIN_LATENCY_SAMPLES,
+    AdaptiveTimeouts,
+    CircuitBreaker,
+)
+
+
+def test_adaptive_timeout_bounds() -> None:
+    """Test timeouts start at the ceiling and follow latency within bounds."""
+    timeouts = AdaptiveTimeouts(floor=2, ceiling=10)
+    assert timeouts.timeout("getZoneData") == 10
+
+    for _ in range(MIN_LATENCY_SAMPLES):
+        timeouts.record("getZoneData", 0.01)
+    assert timeouts.timeout("getZoneData") == 2
+
+    for _ in range(MIN_LATENCY_SAMPLES):
+        timeouts.record("getSystemData", 1.0)
+    assert timeouts.timeout("getSystemData") == 4
+
+    for _ in range(MIN_LATENCY_SAMPLES):
+        timeouts.record("login", 5.0)
+    assert timeouts.timeout("login") == 10
+
+
+def test_circuit_breaker_probes_after_cooldown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the breaker opens, lets one probe through and closes on success."""
+    now = 1000.0
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now)
+    breaker = CircuitBreaker()
+
+    for _ in range(BREAKER_THRESHOLD):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    now += BREAKER_COOLDOWN
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.cooldown == BREAKER_COOLDOWN * 2
+
+    now += BREAKER_COOLDOWN * 2
+    assert breaker.allow()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
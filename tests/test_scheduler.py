@@ -0,0 +1,114 @@
+"""Tests for the MyAir3 request scheduler."""
+
+import asyncio
+
+from custom_components.myair3.scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RequestScheduler,
+)
+
+
+async def test_commands_run_before_queued_polls() -> None:
+    """Test queued commands take the next free slot ahead of polls."""
+    scheduler = RequestScheduler()
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def request(name: str) -> str:
+        order.append(name)
+        if name == "first":
+            await release.wait()
+        return name
+
+    first = asyncio.create_task(scheduler.run(PRIORITY_COMMAND, lambda: request("first")))
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(scheduler.run(PRIORITY_POLL, lambda: request("poll"))),
+        asyncio.create_task(
+            scheduler.run(PRIORITY_COMMAND, lambda: request("command"))
+        ),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 2
+
+    release.set()
+    await asyncio.gather(first, *tasks)
+
+    assert order == ["first", "command", "poll"]
+    assert scheduler.metrics.queue_depth_max == 2
+
+
+async def test_command_aborts_running_poll() -> None:
+    """Test a command aborts a running poll request, which is then retried."""
+    scheduler = RequestScheduler()
+    attempts = 0
+    started = asyncio.Event()
+    order: list[str] = []
+
+    async def slow_poll() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            started.set()
+            await asyncio.sleep(10)
+        order.append("poll")
+        return "poll"
+
+    async def command() -> str:
+        order.append("command")
+        return "command"
+
+    poll = asyncio.create_task(scheduler.run(PRIORITY_POLL, slow_poll))
+    await started.wait()
+    assert await scheduler.run(PRIORITY_COMMAND, command) == "command"
+
+    assert await asyncio.wait_for(poll, 1) == "poll"
+    assert order == ["command", "poll"]
+    assert attempts == 2
+    assert scheduler.metrics.preempted == 1
+
+
+async def test_cancelled_request_leaves_queue() -> None:
+    """Test a caller giving up while queued frees its place."""
+    scheduler = RequestScheduler()
+    release = asyncio.Event()
+
+    running = asyncio.create_task(scheduler.run(PRIORITY_COMMAND, release.wait))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(scheduler.run(PRIORITY_POLL, release.wait))
+    await asyncio.sleep(0)
+    queued.cancel()
+    await asyncio.gather(queued, return_exceptions=True)
+
+    assert scheduler.queue_depth == 0
+    release.set()
+    await running
+
+
+async def test_cancelled_queued_request_is_skipped() -> None:
+    """Test a free slot skips a queued request whose caller gave up."""
+    scheduler = RequestScheduler()
+    release = asyncio.Event()
+
+    async def request(name: str) -> str:
+        if name == "first":
+            await release.wait()
+        return name
+
+    first = asyncio.create_task(scheduler.run(PRIORITY_POLL, lambda: request("first")))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(
+        scheduler.run(PRIORITY_POLL, lambda: request("cancelled"))
+    )
+    second = asyncio.create_task(scheduler.run(PRIORITY_POLL, lambda: request("second")))
+    await asyncio.sleep(0)
+
+    # Free a slot before the cancelled caller gets to clean up
+    cancelled.cancel()
+    scheduler.set_limit(2)
+    release.set()
+
+    assert await asyncio.gather(first, second) == ["first", "second"]
+    assert cancelled.cancelled()
+    assert scheduler.queue_depth == 0
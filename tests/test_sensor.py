@@ -0,0 +1,99 @@
+"""Tests for MyAir3 sensor publishing."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.myair3 import MyAir3Coordinator
+from custom_components.myair3.sensor import MyAir3DamperSensor, PublishFilter
+
+from .emulator import MyAir3Emulator
+
+
+async def test_damper_deadband(hass: HomeAssistant, emulator: MyAir3Emulator) -> None:
+    """Test damper readings within the deadband are held back."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    sensor = MyAir3DamperSensor(
+        coordinator, 1, "entry", PublishFilter(deadband=5, max_interval=900)
+    )
+    sensor.hass = hass
+    sensor.async_write_ha_state = Mock()
+    await sensor.async_added_to_hass()
+    assert sensor.native_value == 50
+
+    emulator.zones[1]["userPercentSetting"] = 53
+    await coordinator.async_refresh()
+    assert sensor.native_value == 50
+    sensor.async_write_ha_state.assert_not_called()
+
+    emulator.zones[1]["userPercentSetting"] = 60
+    await coordinator.async_refresh()
+    assert sensor.native_value == 60
+    sensor.async_write_ha_state.assert_called_once()
+
+    sensor._async_cancel_publish()  # noqa: SLF001
+
+
+async def _added_damper_sensor(
+    hass: HomeAssistant, coordinator: MyAir3Coordinator, publish_filter: PublishFilter
+) -> MyAir3DamperSensor:
+    """Return a zone 1 damper sensor connected to coordinator."""
+    sensor = MyAir3DamperSensor(coordinator, 1, "entry", publish_filter)
+    sensor.hass = hass
+    sensor.async_write_ha_state = Mock()
+    await sensor.async_added_to_hass()
+    return sensor
+
+
+async def test_min_publish_interval(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a change arriving too soon is published once the interval is up."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    sensor = await _added_damper_sensor(
+        hass, coordinator, PublishFilter(min_interval=60)
+    )
+
+    emulator.zones[1]["userPercentSetting"] = 60
+    await coordinator.async_refresh()
+    assert sensor.native_value == 50
+    sensor.async_write_ha_state.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert sensor.native_value == 60
+    sensor.async_write_ha_state.assert_called_once()
+
+    sensor._async_cancel_publish()  # noqa: SLF001
+
+
+async def test_max_publish_interval(
+    hass: HomeAssistant, emulator: MyAir3Emulator
+) -> None:
+    """Test a reading held back by the deadband is published after max_interval."""
+    coordinator = MyAir3Coordinator(hass, emulator.host, "password")
+    await coordinator.async_refresh()
+    sensor = await _added_damper_sensor(
+        hass, coordinator, PublishFilter(deadband=50, max_interval=900)
+    )
+
+    emulator.zones[1]["userPercentSetting"] = 53
+    await coordinator.async_refresh()
+    assert sensor.native_value == 50
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=899))
+    await hass.async_block_till_done()
+    sensor.async_write_ha_state.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=901))
+    await hass.async_block_till_done()
+    assert sensor.native_value == 53
+    sensor.async_write_ha_state.assert_called_once()
+
+    sensor._async_cancel_publish()  # noqa: SLF001